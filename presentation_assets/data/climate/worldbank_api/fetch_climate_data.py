@@ -4,14 +4,23 @@ World Bank Climate Change Knowledge Portal API Data Fetcher
 Fetches climate data for Southern African countries
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import json
+import logging
 import os
 import time
-import requests
-from typing import List, Dict, Optional
+import aiohttp
+import orjson
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from typing import Awaitable, Callable, List, Dict, Optional
 import pandas as pd
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # Southern African country codes (ISO3)
 SOUTHERN_AFRICA_COUNTRIES = {
     "AGO": "Angola",
@@ -44,21 +53,181 @@ SOUTHERN_AFRICA_CITIES = {
     "Gaborone": "BWA.4001",         # Botswana
 }
 
+# Climatology endpoints are immutable, so cached responses stay valid for a long time
+CACHE_TTL_SECONDS = 30 * 86400
+
+
+def disk_memoize(ttl: int = CACHE_TTL_SECONDS):
+    """
+    Cache JSON API responses on disk, keyed by endpoint URL
+    
+    The cache directory and refresh behaviour are taken from the fetcher
+    instance (``cache_dir`` and ``force_refresh``). Failed requests (None)
+    are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, endpoint: str, format: str = "json"):
+            if format != "json":
+                return await func(self, endpoint, format)
+            
+            key = hashlib.blake2b(f"{endpoint}?_format={format}".encode()).hexdigest()
+            path = os.path.join(self.cache_dir, f"{key}.json")
+            
+            if not self.force_refresh and os.path.exists(path):
+                if time.time() - os.path.getmtime(path) < ttl:
+                    with open(path, 'rb') as f:
+                        return orjson.loads(f.read())
+            
+            data = await func(self, endpoint, format)
+            if data is not None:
+                # Write atomically so an interrupted run never leaves a corrupt entry
+                tmp = f"{path}.tmp"
+                with open(tmp, 'wb') as f:
+                    f.write(orjson.dumps(data))
+                os.replace(tmp, path)
+            return data
+        return wrapper
+    return decorator
+
+
+def _file_digest(path: str) -> Optional[bytes]:
+    """blake2b digest of a file read in 1 MiB chunks, or None if it does not exist"""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def write_if_changed(path: str, payload: bytes) -> bool:
+    """Write payload to path unless the file already holds identical bytes"""
+    if _file_digest(path) == hashlib.blake2b(payload).digest():
+        return False
+    with open(path, 'wb') as f:
+        f.write(payload)
+    return True
+
+
+def replace_if_changed(tmp_path: str, path: str) -> bool:
+    """Move tmp_path over path unless the contents are identical (tmp_path is removed)"""
+    if _file_digest(tmp_path) == _file_digest(path):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Retry network errors, timeouts and 5xx/429 responses, but not other 4xx"""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500 or exc.status == 429
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def _select_geocode(response: Dict, geocode: str) -> Optional[Dict]:
+    """
+    Restrict a multi-geocode API response to a single geocode
+    
+    Single-variable responses key ``data`` by geocode; multi-variable
+    responses (e.g. ``tas,tasmax,tasmin``) nest geocodes under each variable.
+    The returned dict has the same shape as a single-geocode response.
+    """
+    data = response.get("data")
+    if not isinstance(data, dict):
+        return None
+    
+    if geocode in data:
+        selected = {geocode: data[geocode]}
+    else:
+        selected = {
+            variable: values[geocode]
+            for variable, values in data.items()
+            if isinstance(values, dict) and geocode in values
+        }
+    
+    if not selected:
+        return None
+    return {**response, "data": selected}
+
+
 class ClimateDataFetcher:
     """Fetches climate data from World Bank Climate API"""
     
     BASE_URL = "https://cckpapi.worldbank.org/cckp/v1"
     
-    def __init__(self, output_dir: str = "./data"):
-        """Initialize the data fetcher"""
+    # Maximum number of requests in flight against the API at once
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    def __init__(self,
+                 output_dir: str = "./data",
+                 force_refresh: bool = False,
+                 emit_csv: bool = False):
+        """
+        Initialize the data fetcher
+        
+        Args:
+            output_dir: Directory for fetched data
+            force_refresh: Ignore cached API responses and re-fetch everything
+            emit_csv: Also write a flattened CSV summary of the combined data
+        """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
-        self.session = requests.Session()
+        self.cache_dir = os.path.join(output_dir, ".cache")
+        self.force_refresh = force_refresh
+        self.emit_csv = emit_csv
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Created lazily inside the running event loop, and released after
+        # each run so the fetcher can be opened again (see open/close)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Blocking save_* calls run here, off the event loop; only their file
+        # writes release the GIL, so encoding itself is not parallel
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    
+    async def open(self):
+        """Open the shared HTTP session and save thread pool"""
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        if self.session is None:
+            # One pooled keep-alive connector so every request to the API host
+            # reuses the same TLS connections instead of re-handshaking
+            connector = aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={
+                    "Connection": "keep-alive",
+                    "Accept-Encoding": "gzip",
+                },
+            )
+            self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+    
+    async def close(self):
+        """Close the shared HTTP session and save thread pool; open() starts new ones"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+    
+    async def __aenter__(self):
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
         
-    def fetch_historical_temperature(self, 
-                                   geocode: str,
-                                   aggregation: str = "annual",
-                                   period: str = "1991-2020") -> Optional[Dict]:
+    async def fetch_historical_temperature(self, 
+                                         geocode: str,
+                                         aggregation: str = "annual",
+                                         period: str = "1991-2020") -> Optional[Dict]:
         """
         Fetch historical temperature data (CRU TS dataset)
         
@@ -70,12 +239,12 @@ class ClimateDataFetcher:
         # CRU historical temperature endpoint
         endpoint = f"{self.BASE_URL}/cru-x0.5_climatology_tas,tasmax,tasmin_climatology_{aggregation}_{period}_mean_historical_mean/all/{geocode}"
         
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
-    def fetch_historical_precipitation(self,
-                                      geocode: str,
-                                      aggregation: str = "annual",
-                                      period: str = "1991-2020") -> Optional[Dict]:
+    async def fetch_historical_precipitation(self,
+                                            geocode: str,
+                                            aggregation: str = "annual",
+                                            period: str = "1991-2020") -> Optional[Dict]:
         """
         Fetch historical precipitation data
         
@@ -87,13 +256,13 @@ class ClimateDataFetcher:
         # CRU historical precipitation endpoint
         endpoint = f"{self.BASE_URL}/cru-x0.5_climatology_pr_climatology_{aggregation}_{period}_mean_historical_mean/all/{geocode}"
         
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
-    def fetch_future_projections(self,
-                                geocode: str,
-                                scenario: str = "ssp245",
-                                period: str = "2040-2059",
-                                variables: str = "tas,tasmax,tasmin,pr") -> Optional[Dict]:
+    async def fetch_future_projections(self,
+                                      geocode: str,
+                                      scenario: str = "ssp245",
+                                      period: str = "2040-2059",
+                                      variables: str = "tas,tasmax,tasmin,pr") -> Optional[Dict]:
         """
         Fetch future climate projections (CMIP6)
         
@@ -106,13 +275,13 @@ class ClimateDataFetcher:
         # CMIP6 future projections endpoint
         endpoint = f"{self.BASE_URL}/cmip6-x0.25_climatology_{variables}_anomaly_annual_{period}_median_{scenario}_ensemble_all_mean/{geocode}"
         
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
-    def fetch_extreme_indices(self,
-                             geocode: str,
-                             index: str = "rx5day",  # Max 5-day rainfall
-                             scenario: str = "ssp245",
-                             period: str = "2040-2059") -> Optional[Dict]:
+    async def fetch_extreme_indices(self,
+                                   geocode: str,
+                                   index: str = "rx5day",  # Max 5-day rainfall
+                                   scenario: str = "ssp245",
+                                   period: str = "2040-2059") -> Optional[Dict]:
         """
         Fetch climate extreme indices
         
@@ -124,179 +293,247 @@ class ClimateDataFetcher:
         """
         endpoint = f"{self.BASE_URL}/cmip6-x1.0_extremes_{index}_absolute_model-median_annual_{period}_mean_{scenario}_mean/all/{geocode}"
         
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
     
-    def _make_request(self, endpoint: str, format: str = "json") -> Optional[Dict]:
+    @disk_memoize()
+    async def _make_request(self, endpoint: str, format: str = "json") -> Optional[Dict]:
         """Make API request with error handling"""
+        if self.session is None:
+            await self.open()
+        
+        url = f"{endpoint}?_format={format}"
         try:
-            url = f"{endpoint}?_format={format}"
-            print(f"Fetching: {url}")
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            if format == "json":
-                return response.json()
-            else:
-                return response.content
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Error fetching data: {e}")
+            return await self._get(url, format)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Giving up on %s: %s", url, e)
             return None
         except json.JSONDecodeError as e:
-            print(f"Error parsing JSON: {e}")
+            logger.warning("Error parsing JSON from %s: %s", url, e)
             return None
     
-    def fetch_all_southern_africa(self):
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True,
+    )
+    async def _get(self, url: str, format: str = "json"):
+        """Issue a single GET, retrying transient failures with exponential backoff"""
+        # Only hold a concurrency slot while the request is in flight, not
+        # during the backoff sleep between attempts
+        async with self._semaphore:
+            print(f"Fetching: {url}")
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                
+                if format == "json":
+                    # CCKP does not always send an application/json content type
+                    return await response.json(content_type=None, loads=orjson.loads)
+                else:
+                    return await response.read()
+    
+    async def fetch_bulk(self,
+                         geocodes: List[str],
+                         fetch: Callable[..., Awaitable[Optional[Dict]]],
+                         **kwargs) -> Dict[str, Dict]:
+        """
+        Fetch one endpoint for many geocodes in a single request
+        
+        The API accepts a comma-joined geocode list (``/all/ZAF,BWA,...``)
+        and returns every geocode in one response.
+        
+        Args:
+            geocodes: Country/city codes to fetch
+            fetch: One of the fetch_* methods, used to build the endpoint
+            **kwargs: Extra arguments passed through to ``fetch``
+            
+        Returns:
+            Mapping of geocode to its part of the response
+        """
+        response = await fetch(",".join(geocodes), **kwargs)
+        if not response:
+            return {}
+        
+        results = {}
+        for code in geocodes:
+            part = _select_geocode(response, code)
+            if part:
+                results[code] = part
+        return results
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking save_* call on the I/O thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, func, *args)
+    
+    async def fetch_all_southern_africa(self):
         """Fetch climate data for all Southern African countries"""
+        codes = list(SOUTHERN_AFRICA_COUNTRIES)
+        print(f"Fetching data for {len(codes)} countries: {', '.join(codes)}")
+        
+        # Fetch future projections for different scenarios
+        scenarios = ["ssp126", "ssp245", "ssp585"]
+        periods = ["2040-2059", "2080-2099"]
+        projection_keys = [(scenario, period) for scenario in scenarios for period in periods]
+        
+        # One request per endpoint covering every country, all issued concurrently
+        temp_hist, precip_hist, extremes, *projections = await asyncio.gather(
+            self.fetch_bulk(codes, self.fetch_historical_temperature),
+            self.fetch_bulk(codes, self.fetch_historical_precipitation),
+            self.fetch_bulk(codes, self.fetch_extreme_indices),
+            *(self.fetch_bulk(codes, self.fetch_future_projections, scenario=scenario, period=period)
+              for scenario, period in projection_keys),
+        )
+        
         results = {}
+        saves = []
         
         for code, name in SOUTHERN_AFRICA_COUNTRIES.items():
-            print(f"\n{'='*50}")
-            print(f"Fetching data for {name} ({code})")
-            print(f"{'='*50}")
-            
             country_data = {}
             
-            # Fetch historical data
-            print("Fetching historical temperature...")
-            temp_hist = self.fetch_historical_temperature(code)
-            if temp_hist:
-                country_data['historical_temperature'] = temp_hist
-            
-            print("Fetching historical precipitation...")
-            precip_hist = self.fetch_historical_precipitation(code)
-            if precip_hist:
-                country_data['historical_precipitation'] = precip_hist
-            
-            # Fetch future projections for different scenarios
-            scenarios = ["ssp126", "ssp245", "ssp585"]
-            periods = ["2040-2059", "2080-2099"]
+            # Historical data
+            if code in temp_hist:
+                country_data['historical_temperature'] = temp_hist[code]
+            if code in precip_hist:
+                country_data['historical_precipitation'] = precip_hist[code]
             
             country_data['projections'] = {}
+            for (scenario, period), proj in zip(projection_keys, projections):
+                if code in proj:
+                    key = f"{scenario}_{period}"
+                    country_data['projections'][key] = proj[code]
             
-            for scenario in scenarios:
-                for period in periods:
-                    print(f"Fetching {scenario} projections for {period}...")
-                    proj = self.fetch_future_projections(code, scenario, period)
-                    if proj:
-                        key = f"{scenario}_{period}"
-                        country_data['projections'][key] = proj
-            
-            # Fetch extreme indices
-            print("Fetching extreme indices...")
-            extremes = self.fetch_extreme_indices(code)
-            if extremes:
-                country_data['extremes'] = extremes
+            # Extreme indices
+            if code in extremes:
+                country_data['extremes'] = extremes[code]
             
             results[code] = country_data
             
             # Save intermediate results
-            self.save_country_data(code, name, country_data)
-            
-            # Be nice to the API
-            time.sleep(1)
+            saves.append(self._run_io(self.save_country_data, code, name, country_data))
         
         # Save combined results
-        self.save_all_data(results)
+        saves.append(self._run_io(self.save_all_data, results))
+        await asyncio.gather(*saves)
         
         return results
     
-    def fetch_city_data(self):
+    async def fetch_city_data(self):
         """Fetch climate data for major Southern African cities"""
+        codes = list(SOUTHERN_AFRICA_CITIES.values())
+        print(f"Fetching data for {len(codes)} cities: {', '.join(SOUTHERN_AFRICA_CITIES)}")
+        
+        # Fetch temperature and precipitation for every city in one request each
+        temp, precip = await asyncio.gather(
+            self.fetch_bulk(codes, self.fetch_historical_temperature),
+            self.fetch_bulk(codes, self.fetch_historical_precipitation),
+        )
+        
         results = {}
+        saves = []
         
         for city, code in SOUTHERN_AFRICA_CITIES.items():
-            print(f"\nFetching data for {city} ({code})")
-            
             city_data = {}
-            
-            # Fetch temperature and precipitation
-            temp = self.fetch_historical_temperature(code)
-            if temp:
-                city_data['temperature'] = temp
-                
-            precip = self.fetch_historical_precipitation(code)
-            if precip:
-                city_data['precipitation'] = precip
+            if code in temp:
+                city_data['temperature'] = temp[code]
+            if code in precip:
+                city_data['precipitation'] = precip[code]
             
             results[city] = city_data
             
             # Save city data
-            self.save_city_data(city, code, city_data)
-            
-            time.sleep(1)
+            saves.append(self._run_io(self.save_city_data, city, code, city_data))
+        
+        await asyncio.gather(*saves)
         
         return results
     
     def save_country_data(self, code: str, name: str, data: Dict):
         """Save individual country data"""
         filename = os.path.join(self.output_dir, f"{code}_{name.replace(' ', '_')}.json")
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Saved: {filename}")
+        if write_if_changed(filename, orjson.dumps(data, option=orjson.OPT_INDENT_2)):
+            print(f"Saved: {filename}")
+        else:
+            print(f"Unchanged: {filename}")
     
     def save_city_data(self, city: str, code: str, data: Dict):
         """Save individual city data"""
         filename = os.path.join(self.output_dir, f"city_{city.replace(' ', '_')}.json")
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Saved: {filename}")
+        if write_if_changed(filename, orjson.dumps(data, option=orjson.OPT_INDENT_2)):
+            print(f"Saved: {filename}")
+        else:
+            print(f"Unchanged: {filename}")
     
     def save_all_data(self, data: Dict):
-        """Save all combined data"""
+        """
+        Save all combined data
+        
+        Each country is encoded separately and streamed to disk, so the full
+        combined document is never held in memory as one string. A JSON-lines
+        sidecar with one country per line is written alongside. Existing
+        files are only replaced when their contents change.
+        """
         filename = os.path.join(self.output_dir, "southern_africa_climate_data.json")
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"\nSaved combined data: {filename}")
+        jsonl_filename = os.path.join(self.output_dir, "southern_africa_climate_data.jsonl")
+        
+        with open(f"{filename}.tmp", 'wb') as f, open(f"{jsonl_filename}.tmp", 'wb') as lines:
+            f.write(b"{")
+            for i, (code, country_data) in enumerate(data.items()):
+                key = orjson.dumps(code)
+                blob = orjson.dumps(country_data)
+                
+                if i:
+                    f.write(b",")
+                f.write(key + b":" + blob)
+                lines.write(b'{"code":' + key + b',"data":' + blob + b"}\n")
+            f.write(b"}")
+        
+        if replace_if_changed(f"{filename}.tmp", filename):
+            print(f"\nSaved combined data: {filename}")
+        else:
+            print(f"\nUnchanged combined data: {filename}")
+        if replace_if_changed(f"{jsonl_filename}.tmp", jsonl_filename):
+            print(f"Saved JSON lines: {jsonl_filename}")
+        else:
+            print(f"Unchanged JSON lines: {jsonl_filename}")
         
         # Also save as CSV for easier analysis
-        self.export_to_csv(data)
+        if self.emit_csv:
+            self.export_to_csv(data)
     
     def export_to_csv(self, data: Dict):
-        """Export data to CSV format for analysis"""
-        rows = []
-        
-        for country_code, country_data in data.items():
-            country_name = SOUTHERN_AFRICA_COUNTRIES.get(country_code, country_code)
-            
-            # Historical data
-            if 'historical_temperature' in country_data:
-                hist_temp = country_data['historical_temperature']
-                # Extract relevant fields (this depends on actual API response structure)
-                # This is a placeholder - adjust based on actual data structure
-                
-            # Projections
-            if 'projections' in country_data:
-                for scenario_period, proj_data in country_data['projections'].items():
-                    # Extract projection data
-                    pass
+        """Export data to CSV format for analysis (one row per country)"""
+        records = [
+            {
+                'country_code': country_code,
+                'country_name': SOUTHERN_AFRICA_COUNTRIES.get(country_code, country_code),
+                **country_data,
+            }
+            for country_code, country_data in data.items()
+        ]
         
-        # Create DataFrame and save
-        if rows:
-            df = pd.DataFrame(rows)
-            csv_file = os.path.join(self.output_dir, "southern_africa_climate_summary.csv")
-            df.to_csv(csv_file, index=False)
-            print(f"Saved CSV: {csv_file}")
+        # Flatten the nested API responses into columns in a single pass
+        df = pd.json_normalize(records, sep='_', max_level=4)
+        csv_file = os.path.join(self.output_dir, "southern_africa_climate_summary.csv")
+        df.to_csv(csv_file, index=False)
+        print(f"Saved CSV: {csv_file}")
 
-
-def main():
+async def main():
     """Main function to fetch all data"""
     print("World Bank Climate API Data Fetcher")
     print("=" * 50)
     
     # Create fetcher instance
-    fetcher = ClimateDataFetcher(
+    async with ClimateDataFetcher(
         output_dir="./southern_africa_climate"
-    )
-    
-    # Fetch country-level data
-    print("\nFetching country-level data...")
-    country_results = fetcher.fetch_all_southern_africa()
-    
-    # Fetch city-level data
-    print("\nFetching city-level data...")
-    city_results = fetcher.fetch_city_data()
+    ) as fetcher:
+        # Fetch country-level data
+        print("\nFetching country-level data...")
+        country_results = await fetcher.fetch_all_southern_africa()
+        
+        # Fetch city-level data
+        print("\nFetching city-level data...")
+        city_results = await fetcher.fetch_city_data()
     
     print("\n" + "=" * 50)
     print("Data fetching complete!")
@@ -316,4 +553,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
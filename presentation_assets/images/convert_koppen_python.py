@@ -4,15 +4,25 @@ Convert Köppen-Geiger climate classification shapefile to GeoJSON
 and clip to African continent boundaries
 """
 
+import argparse
 import geopandas as gpd
 import pandas as pd
+import shapely
 from shapely.geometry import box
 import os
 
 # Set the working directory
 os.chdir('/Users/craig/Library/Mobile Documents/com~apple~CloudDocs/RP2_presentation/presentation_assets/images')
 
+# Simplification tolerance in degrees; a 12in figure at 300dpi spans ~0.02° per pixel
+SIMPLIFY_TOLERANCE = 0.01
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--emit-global', action='store_true',
+                        help='also write the full global dataset to koppen_global.geojson')
+    args = parser.parse_args()
+    
     print("Loading Köppen-Geiger shapefile...")
     
     # Load the shapefile
@@ -22,22 +32,43 @@ def main():
     print(f"Columns in dataset: {list(gdf.columns)}")
     print(f"Current CRS: {gdf.crs}")
     
-    # Ensure the data is in WGS84 (EPSG:4326) for web use
-    if gdf.crs != 'EPSG:4326':
-        print("Reprojecting to WGS84...")
-        gdf = gdf.to_crs('EPSG:4326')
-    
     # Create bounding box for Africa
     # Longitude: -20W to 55E, Latitude: -35S to 40N
-    africa_bbox = box(-20, -35, 55, 40)
+    africa_bbox = gpd.GeoSeries([box(-20, -35, 55, 40)], crs='EPSG:4326')
     
     print("Clipping to Africa boundaries...")
     
-    # Clip to Africa boundaries
-    gdf_africa = gdf.clip(africa_bbox)
+    # Clip in the source CRS first so only the African subset gets reprojected.
+    # Slivers cut down to lines or points on the box edge are dropped, so the
+    # zones stay a polygon coverage for simplifying below
+    gdf_africa = gdf.clip(africa_bbox.to_crs(gdf.crs), keep_geom_type=True)
     
     print(f"After clipping to Africa: {len(gdf_africa)} polygons")
     
+    # Ensure the data is in WGS84 (EPSG:4326) for web use
+    if gdf_africa.crs != 'EPSG:4326':
+        print("Reprojecting to WGS84...")
+        gdf_africa = gdf_africa.to_crs('EPSG:4326')
+    
+    # Merge adjacent polygons of the same climate class, then drop vertices
+    # finer than ~0.01° (well below one pixel at presentation resolution)
+    if 'GRIDCODE' in gdf_africa.columns:
+        # Dissolving leaves one feature per zone, so keep each zone's
+        # polygon count for the statistics downstream
+        polygon_counts = gdf_africa['GRIDCODE'].value_counts()
+        
+        print("Dissolving polygons by GRIDCODE...")
+        gdf_africa = gdf_africa.dissolve(by='GRIDCODE', as_index=False)
+        gdf_africa['polygon_count'] = gdf_africa['GRIDCODE'].map(polygon_counts)
+        print(f"After dissolving: {len(gdf_africa)} features")
+    
+    # The zones tile the continent, so they are simplified as one coverage:
+    # a border shared by two zones is simplified once, leaving no gaps
+    print(f"Simplifying geometries (tolerance {SIMPLIFY_TOLERANCE}°)...")
+    gdf_africa['geometry'] = shapely.coverage_simplify(
+        gdf_africa.geometry.values, SIMPLIFY_TOLERANCE
+    )
+    
     # Check what GRIDCODE values are present in the Africa subset
     if 'GRIDCODE' in gdf_africa.columns:
         unique_codes = sorted(gdf_africa['GRIDCODE'].unique())
@@ -46,14 +77,19 @@ def main():
     # Save different versions
     print("Saving GeoJSON files...")
     
-    # Save full global dataset
-    gdf.to_file('koppen_global.geojson', driver='GeoJSON')
-    print("✓ Saved: koppen_global.geojson")
+    # Save full global dataset (only on request; nothing downstream reads it)
+    if args.emit_global:
+        gdf.to_crs('EPSG:4326').to_file('koppen_global.geojson', driver='GeoJSON')
+        print("✓ Saved: koppen_global.geojson")
     
     # Save Africa-clipped version
     gdf_africa.to_file('koppen_africa.geojson', driver='GeoJSON')
     print("✓ Saved: koppen_africa.geojson")
     
+    # Columnar copy for fast loading in the Python scripts
+    gdf_africa.to_parquet('koppen_africa.parquet', compression='zstd')
+    print("✓ Saved: koppen_africa.parquet")
+    
     # Save a simplified version with only essential fields
     if 'GRIDCODE' in gdf_africa.columns:
         gdf_simple = gdf_africa[['GRIDCODE', 'geometry']].copy()
@@ -63,13 +99,14 @@ def main():
     # Print summary statistics
     print("\n=== Summary ===")
     print(f"Global polygons: {len(gdf)}")
-    print(f"Africa polygons: {len(gdf_africa)}")
+    print(f"Africa features: {len(gdf_africa)}")
     
     if 'GRIDCODE' in gdf_africa.columns:
+        print(f"Africa polygons before dissolving: {gdf_africa['polygon_count'].sum()}")
         print(f"Unique climate zones in Africa: {len(gdf_africa['GRIDCODE'].unique())}")
         
         # Show the distribution of climate zones
-        climate_counts = gdf_africa['GRIDCODE'].value_counts().sort_index()
+        climate_counts = gdf_africa.set_index('GRIDCODE')['polygon_count'].sort_index()
         print("\nClimate zone distribution in Africa:")
         for code, count in climate_counts.head(10).items():  # Show top 10
             print(f"  GRIDCODE {code}: {count} polygons")
@@ -6,15 +6,28 @@ Created following Nature/Science publication standards
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+import matplotlib.colors as mcolors
 import geopandas as gpd
 import pandas as pd
 import numpy as np
+import shapely
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import ListedColormap
 from matplotlib.patches import Rectangle
+from rasterio import features
+from rasterio.transform import from_bounds
+import argparse
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# Map extent for Africa (west, east, south, north)
+MAP_EXTENT = (-20, 55, -35, 40)
+
+# Pixel grid for the rasterized climate layer (~0.05° per cell)
+RASTER_SHAPE = (1500, 1500)
+
 # Set publication-quality style
-plt.style.use('default')
 plt.rcParams.update({
     'font.family': 'sans-serif',
     'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans'],
@@ -34,8 +47,11 @@ plt.rcParams.update({
 def load_climate_data():
     """Load and process Köppen-Geiger climate data"""
     try:
-        # Load the GeoJSON data
-        gdf = gpd.read_file('koppen_africa_with_labels.geojson')
+        # Prefer the GeoParquet copy; parsing the GeoJSON is much slower
+        if os.path.exists('koppen_africa_with_labels.parquet'):
+            gdf = gpd.read_parquet('koppen_africa_with_labels.parquet')
+        else:
+            gdf = gpd.read_file('koppen_africa_with_labels.geojson')
         print(f"Loaded {len(gdf)} climate polygons")
         
         # Print unique climate zones found
@@ -71,8 +87,54 @@ def get_climate_colors():
     }
     return colors
 
-def create_africa_map():
-    """Create the main map figure"""
+def climate_class_index(koppen_codes, climate_colors):
+    """Index of each Köppen code in the palette; unknown codes map to len(palette)"""
+    codes = pd.Categorical(koppen_codes, categories=list(climate_colors.keys())).codes
+    return np.where(codes == -1, len(climate_colors), codes)
+
+def climate_color_table(climate_colors, missing='#cccccc'):
+    """RGBA table matching climate_class_index, with `missing` as the last row"""
+    return np.array([mcolors.to_rgba(c) for c in climate_colors.values()]
+                    + [mcolors.to_rgba(missing)])
+
+def climate_rgba(koppen_codes, climate_colors, missing='#cccccc'):
+    """Look up an RGBA row per Köppen code, using `missing` for unknown codes"""
+    color_table = climate_color_table(climate_colors, missing)
+    return color_table[climate_class_index(koppen_codes, climate_colors)]
+
+def rasterize_climate_zones(climate_gdf, climate_colors, shape=RASTER_SHAPE):
+    """Burn climate polygons into a masked grid of palette indices over MAP_EXTENT"""
+    west, east, south, north = MAP_EXTENT
+    classes = climate_class_index(climate_gdf['koppen_code'], climate_colors)
+    grid = features.rasterize(
+        zip(climate_gdf.geometry, classes.tolist()),
+        out_shape=shape,
+        transform=from_bounds(west, south, east, north, shape[1], shape[0]),
+        fill=255,
+        dtype='uint8'
+    )
+    return np.ma.masked_equal(grid, 255)
+
+def polygon_vertices(geometries):
+    """
+    Split (Multi)Polygons into exterior-ring vertex arrays
+    
+    Returns the list of (N, 2) vertex arrays and, for each one, the index of
+    the geometry it came from.
+    """
+    parts, part_index = shapely.get_parts(geometries, return_index=True)
+    rings = shapely.get_exterior_ring(parts)
+    coords = shapely.get_coordinates(rings)
+    offsets = np.cumsum(shapely.get_num_coordinates(rings))[:-1]
+    return np.split(coords, offsets), part_index
+
+def create_africa_map(vector=False):
+    """
+    Create the main map figure
+    
+    Climate zones are drawn as a rasterized image by default; pass
+    vector=True to draw them as polygons instead.
+    """
     # Create figure with publication dimensions
     fig, ax = plt.subplots(1, 1, figsize=(12, 9), dpi=300)
     
@@ -80,26 +142,21 @@ def create_africa_map():
     climate_gdf = load_climate_data()
     climate_colors = get_climate_colors()
     
-    if climate_gdf is not None:
-        # Plot climate zones
-        for idx, row in climate_gdf.iterrows():
-            climate_code = row['koppen_code']
-            color = climate_colors.get(climate_code, '#cccccc')
-            
-            # Plot the polygon
-            if row.geometry.geom_type == 'Polygon':
-                coords = list(row.geometry.exterior.coords)
-                x_coords = [coord[0] for coord in coords]
-                y_coords = [coord[1] for coord in coords]
-                ax.fill(x_coords, y_coords, color=color, alpha=0.7, 
-                       edgecolor='white', linewidth=0.1)
-            elif row.geometry.geom_type == 'MultiPolygon':
-                for geom in row.geometry.geoms:
-                    coords = list(geom.exterior.coords)
-                    x_coords = [coord[0] for coord in coords]
-                    y_coords = [coord[1] for coord in coords]
-                    ax.fill(x_coords, y_coords, color=color, alpha=0.7,
-                           edgecolor='white', linewidth=0.1)
+    if climate_gdf is not None and vector:
+        # Plot climate zones as a single collection instead of one artist per polygon
+        rgba = climate_rgba(climate_gdf['koppen_code'], climate_colors)
+        verts, part_index = polygon_vertices(climate_gdf.geometry.values)
+        zones = PolyCollection(verts, facecolors=rgba[part_index],
+                               alpha=0.7, edgecolors='white', linewidths=0.1)
+        ax.add_collection(zones)
+    elif climate_gdf is not None:
+        # Draw climate zones as one image; cost no longer depends on vertex count
+        west, east, south, north = MAP_EXTENT
+        color_table = climate_color_table(climate_colors)
+        grid = rasterize_climate_zones(climate_gdf, climate_colors)
+        ax.imshow(grid, extent=[west, east, south, north], origin='upper',
+                 cmap=ListedColormap(color_table), vmin=0, vmax=len(color_table) - 1,
+                 interpolation='nearest', alpha=0.7, aspect='auto')
     
     # Study locations
     study_locations = [
@@ -126,8 +183,8 @@ def create_africa_map():
                             edgecolor='none', alpha=0.8))
     
     # Set map extent for Africa
-    ax.set_xlim(-20, 55)
-    ax.set_ylim(-35, 40)
+    ax.set_xlim(MAP_EXTENT[0], MAP_EXTENT[1])
+    ax.set_ylim(MAP_EXTENT[2], MAP_EXTENT[3])
     
     # Add country boundaries (simplified)
     add_country_labels(ax)
@@ -243,10 +300,15 @@ Johannesburg: 11,800 participants"""
 
 def main():
     """Main function to create the visualization"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--vector', action='store_true',
+                        help='draw climate zones as vector polygons instead of a raster layer')
+    args = parser.parse_args()
+    
     print("Creating African climate zone map with study locations...")
     
     # Create the map
-    fig, ax, climate_gdf, climate_colors = create_africa_map()
+    fig, ax, climate_gdf, climate_colors = create_africa_map(vector=args.vector)
     
     # Add legend
     create_legend(ax, climate_gdf, climate_colors)
@@ -255,21 +317,24 @@ def main():
     add_statistics_panel(fig)
     
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Save high-resolution figure
+    # Save high-resolution figure; zlib level 1 keeps the PNG lossless but
+    # avoids spending most of the save time on compression
     output_file = 'africa_climate_study_locations.png'
-    plt.savefig(output_file, dpi=300, bbox_inches='tight', 
-               facecolor='white', edgecolor='none')
+    fig.savefig(output_file, dpi=300, bbox_inches='tight', 
+               facecolor='white', edgecolor='none',
+               metadata={'Software': None},
+               pil_kwargs={'compress_level': 1, 'optimize': False})
     
     # Save as SVG (vector format)
-    plt.savefig('africa_climate_study_locations.svg', 
+    fig.savefig('africa_climate_study_locations.svg', 
                bbox_inches='tight', facecolor='white', edgecolor='none')
     
     print(f"Map saved as {output_file} and .svg")
     
     # Also save as PDF for publication
-    plt.savefig('africa_climate_study_locations.pdf', 
+    fig.savefig('africa_climate_study_locations.pdf', 
                bbox_inches='tight', facecolor='white', edgecolor='none')
     
     plt.show()
@@ -4,9 +4,15 @@ Create scientific climate data visualizations for Southern Africa
 Generates SVG maps showing temperature, precipitation, and vulnerability indices
 """
 
+import gzip
+import functools
+import hashlib
 import json
+import re
 import numpy as np
+from string import Template
 from pathlib import Path
+from xml.parsers import expat
 
 # Southern Africa countries with ND-GAIN vulnerability scores (2023)
 SOUTHERN_AFRICA_DATA = {
@@ -38,509 +44,729 @@ PRECIPITATION_DATA = {
     "Zimbabwe": {"annual_change": -10, "wet_season": -13, "dry_season": -7}
 }
 
-def create_temperature_anomaly_map():
-    """Create SVG map showing temperature anomalies across Southern Africa"""
-    
-    svg_content = '''<svg width="1200" height="800" xmlns="http://www.w3.org/2000/svg">
-  <!-- Title and Background -->
-  <rect width="1200" height="800" fill="#f8f9fa"/>
-  
-  <!-- Title -->
-  <text x="600" y="40" font-family="Arial, sans-serif" font-size="24" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-    Southern Africa Temperature Anomaly (°C above 1961-1990 baseline)
-  </text>
-  <text x="600" y="65" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
-    Observed warming 1991-2020 with projected increase by 2050 (SSP2-4.5)
-  </text>
-  
-  <!-- Map Container -->
-  <g transform="translate(100, 100)">
-    <!-- Simplified country shapes with temperature gradient fills -->
-    
-    <!-- South Africa -->
+# Simplified country shapes in map coordinates: a path outline with its label
+# anchor and label font size, or a circle for the small enclaved countries.
+# Listed in drawing order (enclaves last so they sit on top of South Africa).
+COUNTRY_GEOM = {
+    "ZAF": {"d": "M 400 400 L 550 380 L 600 420 L 580 480 L 500 500 L 400 480 Z", "cx": 500, "cy": 450, "font": 14},
+    "NAM": {"d": "M 250 300 L 350 280 L 380 400 L 300 420 L 250 380 Z", "cx": 315, "cy": 350, "font": 14},
+    "BWA": {"d": "M 380 300 L 480 290 L 500 380 L 400 400 L 380 350 Z", "cx": 440, "cy": 340, "font": 14},
+    "ZWE": {"d": "M 500 280 L 580 270 L 600 340 L 520 360 L 500 320 Z", "cx": 550, "cy": 310, "font": 14},
+    "MOZ": {"d": "M 600 270 L 680 250 L 700 450 L 620 470 L 600 420 Z", "cx": 650, "cy": 360, "font": 14},
+    "ZMB": {"d": "M 480 200 L 580 190 L 600 270 L 500 280 L 480 240 Z", "cx": 540, "cy": 235, "font": 14},
+    "AGO": {"d": "M 300 100 L 480 80 L 500 200 L 380 220 L 300 180 Z", "cx": 400, "cy": 150, "font": 14},
+    "MWI": {"d": "M 620 240 L 650 230 L 660 340 L 630 350 L 620 300 Z", "cx": 640, "cy": 285, "font": 12},
+    "MDG": {"d": "M 780 250 L 820 240 L 840 450 L 800 460 L 780 350 Z", "cx": 810, "cy": 350, "font": 14},
+    "LSO": {"r": 25, "cx": 520, "cy": 460},
+    "SWZ": {"r": 20, "cx": 570, "cy": 440},
+}
+
+# Country name lookup by ISO3 code
+COUNTRY_NAMES = {data["code"]: name for name, data in SOUTHERN_AFRICA_DATA.items()}
+
+# Structure-of-arrays view of the data tables in map drawing order; the map
+# builders index these by country position i instead of doing dict lookups
+CODES = np.array(list(COUNTRY_GEOM))
+NAMES = np.array([COUNTRY_NAMES[code] for code in CODES])
+VULN = np.fromiter((SOUTHERN_AFRICA_DATA[name]["vulnerability"] for name in NAMES),
+                   dtype=np.float32, count=len(NAMES))
+READY = np.fromiter((SOUTHERN_AFRICA_DATA[name]["readiness"] for name in NAMES),
+                    dtype=np.float32, count=len(NAMES))
+# Temperature anomalies in tenths of a degree, the precision of the source data
+TEMP = np.fromiter((round(SOUTHERN_AFRICA_DATA[name]["temp_anomaly"] * 10) for name in NAMES),
+                   dtype=np.int8, count=len(NAMES))
+PRECIP_ANNUAL = np.fromiter((PRECIPITATION_DATA[name]["annual_change"] for name in NAMES),
+                            dtype=np.int8, count=len(NAMES))
+PRECIP_WET = np.fromiter((PRECIPITATION_DATA[name]["wet_season"] for name in NAMES),
+                         dtype=np.int8, count=len(NAMES))
+PRECIP_DRY = np.fromiter((PRECIPITATION_DATA[name]["dry_season"] for name in NAMES),
+                         dtype=np.int8, count=len(NAMES))
+
+# Colour classes matching the map legends. np.digitize maps each value to a
+# palette index; temperature bins (in tenths of a degree) are closed on the
+# right (13 is "1.1-1.3"). Vulnerability bins share the float32 dtype of the
+# data so edge values compare exactly
+TEMP_BINS = np.array([9, 11, 13, 15], dtype=np.int8)
+TEMP_PALETTE = np.array(["#fee090", "#fdae61", "#f46d43", "#d73027", "#a50026"])
+
+PRECIP_BINS = np.array([-15, -10, -7, -4], dtype=np.int8)
+PRECIP_PALETTE = np.array(["#543005", "#8c510a", "#bf812d", "#dfc27d", "#f6e8c3"])
+
+# Country fill gradients per colour class: from the class colour to the next
+# milder class (or a near-white for the mildest class)
+TEMP_GRADIENT_PAIRS = list(zip(TEMP_PALETTE, ["#f7f7f7", *TEMP_PALETTE[:-1]]))
+PRECIP_GRADIENT_PAIRS = list(zip(PRECIP_PALETTE, [*PRECIP_PALETTE[1:], "#f5f5f5"]))
+
+VULN_BINS = np.array([0.40, 0.45, 0.50, 0.55], dtype=np.float32)
+VULN_FILLS = np.array(["#74add1", "#fee090", "#fdae61", "#f46d43", "#d73027"])
+VULN_STROKES = np.array(["#4575b4", "#fdae61", "#f46d43", "#d73027", "#8b0000"])
+VULN_TEXT_COLORS = np.array(["white", "#2c3e50", "#2c3e50", "white", "white"])
+VULN_LEVELS = ["Lower", "Low-Med", "Medium", "High", "Very High"]
+
+# Vulnerability scatter bubble placement: readiness (x) and vulnerability (y,
+# upwards) affine-mapped onto the 600x400 plot, inset by the largest radius so
+# every bubble stays inside it; radius also grows with vulnerability
+VULN_PLOT_WIDTH, VULN_PLOT_HEIGHT = 600, 400
+VULN_RADIUS_MIN, VULN_RADIUS_MAX = 33, 45
+
+def _bubble_layout(vulnerability, readiness):
+    """Map vulnerability/readiness arrays to integer bubble x, y and radius arrays"""
+    pad = VULN_RADIUS_MAX + 5
+    v_norm = (vulnerability - vulnerability.min()) / np.ptp(vulnerability)
+    r_norm = (readiness - readiness.min()) / np.ptp(readiness)
+    xs = (pad + r_norm * (VULN_PLOT_WIDTH - 2 * pad)).astype(np.int32)
+    ys = (pad + (1 - v_norm) * (VULN_PLOT_HEIGHT - 2 * pad)).astype(np.int32)
+    radii = (VULN_RADIUS_MIN + v_norm * (VULN_RADIUS_MAX - VULN_RADIUS_MIN)).astype(np.int32)
+    return xs, ys, radii
+
+VULN_X, VULN_Y, VULN_R = _bubble_layout(VULN, READY)
+# Drawn largest (most vulnerable) first so smaller bubbles sit on top
+VULN_ORDER = np.argsort(-VULN, kind="stable")
+VULN_CLASSES = np.digitize(VULN, VULN_BINS)
+
+# Integrated risk matrix bubbles in drawing order, one column per attribute.
+# Positions are (climate stress, vulnerability) in matrix coordinates
+RISK_CODES = ["MOZ", "MDG", "ZWE", "MWI", "ZMB", "AGO", "LSO", "SWZ", "NAM", "BWA", "ZAF"]
+RISK_LABELS = [
+    "Mozambique - Extreme Risk",
+    "Madagascar - Very High Risk",
+    "Zimbabwe - High Risk",
+    "Malawi - High Risk",
+    "Zambia - Moderate-High Risk",
+    "Angola - Moderate-High Risk",
+    "Lesotho - Moderate Risk",
+    "Eswatini - Moderate Risk",
+    "Namibia - Moderate Risk (high climate stress, lower vulnerability)",
+    "Botswana - Lower-Moderate Risk",
+    "South Africa - Lower Risk (relative)",
+]
+RISK_POS = np.array([[680, 60], [520, 80], [480, 180], [520, 210], [380, 180], [320, 150],
+                     [420, 280], [380, 310], [480, 340], [280, 360], [220, 400]])
+RISK_R = np.array([30, 28, 26, 26, 25, 25, 24, 23, 24, 23, 22])
+
+# Bubble colour classes from a combined risk score: climate stress (x) plus
+# vulnerability (y, upwards), each normalised to the 800x500 matrix
+RISK_MATRIX_WIDTH, RISK_MATRIX_HEIGHT = 800, 500
+RISK_BINS = np.array([0.55, 0.80, 1.00, 1.15, 1.30, 1.60])
+RISK_FILLS = np.array(["#abd9e9", "#e0f3f8", "#fee090", "#fdae61", "#f46d43", "#d73027", "#8b0000"])
+RISK_STROKES = np.array(["#74add1", "#abd9e9", "#fdae61", "#f46d43", "#d73027", "#8b0000", "#4d0000"])
+RISK_TEXT_COLORS = np.array(["#2c3e50", "#2c3e50", "#2c3e50", "#2c3e50", "white", "white", "white"])
+
+# Background zone colour per matrix cell, top row = highest vulnerability
+RISK_ZONE_COLORS = np.array([
+    ["#fee090", "#fdae61", "#f46d43", "#d73027"],
+    ["#e0f3f8", "#fee090", "#fdae61", "#f46d43"],
+    ["#abd9e9", "#e0f3f8", "#fee090", "#fdae61"],
+    ["#74add1", "#abd9e9", "#e0f3f8", "#fee090"],
+])
+
+RISK_SCORE = RISK_POS[:, 0] / RISK_MATRIX_WIDTH + 1 - RISK_POS[:, 1] / RISK_MATRIX_HEIGHT
+RISK_CLASSES = np.digitize(RISK_SCORE, RISK_BINS)
+
+# Temporal chart axes, mapped linearly onto its 900x400 plot: years along x,
+# temperature anomaly (°C) up the left and precipitation change (%) down the
+# right from the 0% line. Labels sit 5px below their level to centre on it
+TEMPORAL_PLOT_WIDTH, TEMPORAL_PLOT_HEIGHT = 900, 400
+TEMPORAL_SPAN = (1960, 2080)
+TEMPORAL_PRESENT = 2020
+TEMPORAL_TEMP_SCALE = 100
+TEMPORAL_PRECIP_ZERO, TEMPORAL_PRECIP_SCALE = 200, 10
+TEMPORAL_YEARS = np.arange(1960, 2081, 20)
+TEMPORAL_X = np.interp(TEMPORAL_YEARS, TEMPORAL_SPAN, (0, TEMPORAL_PLOT_WIDTH)).astype(np.int32)
+TEMPORAL_TEMPS = np.arange(5)
+TEMPORAL_TEMP_Y = TEMPORAL_PLOT_HEIGHT - TEMPORAL_TEMP_SCALE * TEMPORAL_TEMPS
+TEMPORAL_PRECIP = np.arange(0, -16, -5)
+TEMPORAL_PRECIP_Y = TEMPORAL_PRECIP_ZERO - TEMPORAL_PRECIP_SCALE * TEMPORAL_PRECIP
+
+# Observed regional anomalies at TEMPORAL_YEARS up to the present
+TEMPORAL_OBSERVED_TEMP = np.array([0.5, 0.6, 0.8, 1.2])
+TEMPORAL_OBSERVED_PRECIP = np.array([0.0, -1.0, -2.5, -4.5])
+
+# Projections continue from the last observation as a quadratic trend in
+# decades since the present: (rate per decade, change in rate per decade).
+# Temperature scenarios also carry their line colour and dash pattern
+TEMPORAL_PROJECTION_YEARS = np.linspace(TEMPORAL_PRESENT, TEMPORAL_SPAN[1], 31)
+TEMPORAL_SCENARIOS = [
+    ("SSP1-2.6 (Low emissions)", 0.15, -0.0125, "#4575b4", "5,3"),
+    ("SSP2-4.5 (Medium emissions)", 0.25, 0.0, "#fdae61", "none"),
+    ("SSP5-8.5 (High emissions)", 0.35, 0.005, "#d73027", "8,4"),
+]
+TEMPORAL_PRECIP_TREND = (-1.1, 0.0)
+
+# Integrated diagram risk timeline: decades along a 1000px axis, with the
+# risk progression curves as quadratic trends (px above the axis): (label,
+# level at the present, rate per decade, change in rate per decade, colour)
+TIMELINE_YEARS = np.arange(2020, 2061, 10)
+TIMELINE_X = np.interp(TIMELINE_YEARS, (2020, 2060), (100, 1100)).astype(np.int32)
+TIMELINE_AXIS_Y = 100
+TIMELINE_TRENDS = [
+    ("Temperature", 10, 5, 1.25, "#d73027"),
+    ("Drought", 5, 2, 0.75, "#8c510a"),
+    ("Overall Risk", 15, 5, 1.25, "#4575b4"),
+]
+
+TEMP_COUNTRY_TMPL = '''    <!-- %s -->
     <g>
-      <path d="M 400 400 L 550 380 L 600 420 L 580 480 L 500 500 L 400 480 Z" 
-            fill="url(#tempGradientZAF)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="500" y="450" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        South Africa
+      <path d="%s" 
+            fill="url(#tempGradient%d)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
+      <text x="%d" y="%d" font-size="%d" class="lbl">
+        %s
       </text>
-      <text x="500" y="470" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#d73027">
-        +1.4°C
+      <text x="%d" y="%d" font-size="%d" class="val" fill="%s">
+        +%.1f°C
       </text>
     </g>
     
-    <!-- Namibia -->
+'''
+
+TEMP_SMALL_COUNTRY_TMPL = '''    <!-- %s -->
     <g>
-      <path d="M 250 300 L 350 280 L 380 400 L 300 420 L 250 380 Z" 
-            fill="url(#tempGradientNAM)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="315" y="350" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Namibia
-      </text>
-      <text x="315" y="370" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#a50026">
-        +1.6°C
+      <circle cx="%d" cy="%d" r="%d" fill="url(#tempGradient%d)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
+      <text x="%d" y="%d" class="sm">
+        %s +%.1f°C
       </text>
     </g>
     
-    <!-- Botswana -->
+'''
+
+PRECIP_COUNTRY_TMPL = '''    <!-- %s -->
     <g>
-      <path d="M 380 300 L 480 290 L 500 380 L 400 400 L 380 350 Z" 
-            fill="url(#tempGradientBWA)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="440" y="340" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Botswana
+      <path d="%s" 
+            fill="url(#precipGradient%d)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
+      <text x="%d" y="%d" font-size="%d" class="lbl">
+        %s
       </text>
-      <text x="440" y="360" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#d73027">
-        +1.4°C
-      </text>
-    </g>
-    
-    <!-- Zimbabwe -->
-    <g>
-      <path d="M 500 280 L 580 270 L 600 340 L 520 360 L 500 320 Z" 
-            fill="url(#tempGradientZWE)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="550" y="310" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Zimbabwe
+      <text x="%d" y="%d" font-size="%d" class="val" fill="%s">
+        %d%%
       </text>
-      <text x="550" y="330" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#f46d43">
-        +1.2°C
+      <text x="%d" y="%d" font-size="%d" class="det">
+        %s
       </text>
     </g>
     
-    <!-- Mozambique -->
+'''
+
+PRECIP_SMALL_COUNTRY_TMPL = '''    <!-- %s -->
     <g>
-      <path d="M 600 270 L 680 250 L 700 450 L 620 470 L 600 420 Z" 
-            fill="url(#tempGradientMOZ)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="650" y="360" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Mozambique
-      </text>
-      <text x="650" y="380" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#fdae61">
-        +1.0°C
+      <circle cx="%d" cy="%d" r="%d" fill="url(#precipGradient%d)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
+      <text x="%d" y="%d" class="sm">
+        %s %d%%
       </text>
     </g>
     
-    <!-- Zambia -->
-    <g>
-      <path d="M 480 200 L 580 190 L 600 270 L 500 280 L 480 240 Z" 
-            fill="url(#tempGradientZMB)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="540" y="235" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Zambia
-      </text>
-      <text x="540" y="255" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#f46d43">
-        +1.3°C
-      </text>
+'''
+
+VULN_BUBBLE_TMPL = '''    <!-- %s -->
+    <g transform="translate(%d, %d)">
+      <circle r="%d" fill="%s" fill-opacity="0.7" stroke="%s" stroke-width="2"/>
+      <text y="0" class="code" fill="%s">%s</text>
+      <text y="15" class="score" fill="%s">%.3f</text>
     </g>
     
-    <!-- Angola -->
-    <g>
-      <path d="M 300 100 L 480 80 L 500 200 L 380 220 L 300 180 Z" 
-            fill="url(#tempGradientAGO)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="400" y="150" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Angola
-      </text>
-      <text x="400" y="170" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#f46d43">
-        +1.2°C
-      </text>
-    </g>
+'''
+
+# Risk-matrix bubbles are drawn as one <path> of arc pairs per colour class,
+# with the country codes as separate labels on top
+RISK_CIRCLE_ARCS_TMPL = "M%d %da%d,%d 0 1,0 %d,0a%d,%d 0 1,0 %d,0"
+
+RISK_CIRCLES_TMPL = '''    <path d="%s"
+          fill="%s" fill-opacity="0.8" stroke="%s" stroke-width="2"/>
+'''
+
+RISK_LABEL_TMPL = '''    <!-- %s -->
+    <text x="%d" y="%d" class="s14 b m" fill="%s">%s</text>
+'''
+
+SCENARIO_CURVE_TMPL = '''    <!-- %s -->
+    <path d="%s"
+          fill="none" stroke="%s" stroke-width="2" stroke-dasharray="%s"/>
     
-    <!-- Malawi -->
-    <g>
-      <path d="M 620 240 L 650 230 L 660 340 L 630 350 L 620 300 Z" 
-            fill="url(#tempGradientMWI)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="640" y="285" font-family="Arial" font-size="12" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Malawi
-      </text>
-      <text x="640" y="305" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#fdae61">
-        +1.1°C
-      </text>
-    </g>
+'''
+
+TEMPORAL_TRENDS_TMPL = '''    <!-- Temperature trends -->
+    <!-- Historical observed -->
+    <path d="%s"
+          fill="none" stroke="#333333" stroke-width="3"/>
     
-    <!-- Madagascar -->
-    <g>
-      <path d="M 780 250 L 820 240 L 840 450 L 800 460 L 780 350 Z" 
-            fill="url(#tempGradientMDG)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="810" y="350" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Madagascar
-      </text>
-      <text x="810" y="370" font-family="Arial" font-size="20" font-weight="bold" text-anchor="middle" fill="#fee090">
-        +0.9°C
-      </text>
-    </g>
+%s    <!-- Precipitation trends (inverted scale) -->
+    <!-- Historical observed -->
+    <path d="%s"
+          fill="none" stroke="#8c510a" stroke-width="3" opacity="0.7"/>
     
-    <!-- Lesotho (small, within South Africa) -->
-    <g>
-      <circle cx="520" cy="460" r="25" fill="url(#tempGradientLSO)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="520" y="465" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        LSO +1.5°C
-      </text>
-    </g>
+    <!-- Future projections -->
+    <path d="%s"
+          fill="none" stroke="#8c510a" stroke-width="2" opacity="0.5" stroke-dasharray="5,3"/>
     
-    <!-- Eswatini (small, within South Africa) -->
-    <g>
-      <circle cx="570" cy="440" r="20" fill="url(#tempGradientSWZ)" stroke="#2c3e50" stroke-width="2" opacity="0.9"/>
-      <text x="570" y="445" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        SWZ +1.3°C
-      </text>
+'''
+
+TIMELINE_TREND_TMPL = '''    <path d="%s"
+          fill="none" stroke="%s" stroke-width="3" opacity="0.7"/>
+    <text x="1120" y="%d" class="s11" fill="%s">%s</text>
+    
+'''
+
+AXIS_LABEL_TMPL = '''    <text x="%d" y="%d" %s>%s</text>
+'''
+
+# Scatter quadrant captions: (x, y, colour, title, subtitle). Each pair shares
+# its position and colour through the enclosing group
+VULN_QUADRANTS = [
+    (150, 100, "#d73027", "High Risk", "(High Vuln, Low Ready)"),
+    (450, 100, "#fdae61", "Moderate Risk", "(High Vuln, High Ready)"),
+    (150, 350, "#fee090", "Building Resilience", "(Low Vuln, Low Ready)"),
+    (450, 350, "#74add1", "Most Prepared", "(Low Vuln, High Ready)"),
+]
+
+VULN_LEGEND_ENTRY_TMPL = '''    <circle cx="20" cy="%d" r="15" fill="%s" fill-opacity="0.7" stroke="%s" stroke-width="1"/>
+    <text x="45" y="%d" font-size="12" fill="#2c3e50">%s</text>
+'''
+
+QUADRANT_LABEL_TMPL = '''    <g transform="translate(%d, %d)" text-anchor="middle" fill="%s">
+      <text font-size="12" font-style="italic">%s</text>
+      <text y="15" font-size="11">%s</text>
     </g>
-  </g>
+'''
+
+GRADIENT_TMPL = '''    <linearGradient id="%s" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0" style="stop-color:%s;stop-opacity:%g" />
+      <stop offset="1" style="stop-color:%s;stop-opacity:%g" />
+    </linearGradient>
+'''
+
+# Colour classes are fixed by the data tables above, so classify them and
+# build the gradient <defs> blocks once at import time. Countries in the same
+# class share one gradient (tempGradient<class>) instead of one per country
+TEMP_CLASSES = np.digitize(TEMP, TEMP_BINS, right=True)
+PRECIP_CLASSES = np.digitize(PRECIP_ANNUAL, PRECIP_BINS)
+
+_TEMP_DEFS = ("  <defs>\n"
+              + "".join(GRADIENT_TMPL % ("tempGradient%d" % b, TEMP_GRADIENT_PAIRS[b][0], 0.8,
+                                         TEMP_GRADIENT_PAIRS[b][1], 0.8)
+                        for b in np.unique(TEMP_CLASSES))
+              + "  </defs>\n")
+
+_PRECIP_DEFS = ("  <defs>\n"
+                "    <!-- Each gradient reflects precipitation change severity -->\n"
+                + "".join(GRADIENT_TMPL % ("precipGradient%d" % b, PRECIP_GRADIENT_PAIRS[b][0], 0.7,
+                                           PRECIP_GRADIENT_PAIRS[b][1], 0.7)
+                          for b in np.unique(PRECIP_CLASSES))
+                + "  </defs>\n")
+
+def _temperature_countries():
+    """Yield the temperature map country groups"""
+    
+    # Bind the template formatters once, and iterate plain-list
+    # columns rather than indexing numpy scalars per country
+    country_fmt, small_fmt = TEMP_COUNTRY_TMPL.__mod__, TEMP_SMALL_COUNTRY_TMPL.__mod__
+    records = zip(COUNTRY_GEOM.values(), CODES.tolist(), NAMES.tolist(),
+                  (TEMP / 10).tolist(), TEMP_CLASSES.tolist(), TEMP_PALETTE[TEMP_CLASSES].tolist())
+    
+    for geom, code, name, temp, cls, fill in records:
+        if "d" in geom:
+            cx, cy, font = geom["cx"], geom["cy"], geom["font"]
+            yield country_fmt((name, geom["d"], cls,
+                               cx, cy, font, name, cx, cy + 20, font + 6, fill, temp))
+        else:
+            cx, cy = geom["cx"], geom["cy"]
+            yield small_fmt((name, cx, cy, geom["r"], cls, cx, cy + 5, code, temp))
+
+def _precipitation_countries():
+    """Yield the precipitation map country groups"""
+    
+    country_fmt, small_fmt = PRECIP_COUNTRY_TMPL.__mod__, PRECIP_SMALL_COUNTRY_TMPL.__mod__
+    records = zip(COUNTRY_GEOM.values(), CODES.tolist(), NAMES.tolist(), PRECIP_ANNUAL.tolist(),
+                  PRECIP_WET.tolist(), PRECIP_DRY.tolist(), PRECIP_CLASSES.tolist(),
+                  PRECIP_PALETTE[PRECIP_CLASSES].tolist())
+    
+    for geom, code, name, annual, wet, dry, cls, fill in records:
+        if "d" in geom:
+            cx, cy, font = geom["cx"], geom["cy"], geom["font"]
+            # Narrow countries get the abbreviated seasonal breakdown
+            seasonal = "Wet: %+d%% | Dry: %+d%%" if font >= 14 else "W:%+d%% | D:%+d%%"
+            yield country_fmt((name, geom["d"], cls,
+                               cx, cy - 10, font, name,
+                               cx, cy + 10, font + 4, fill, annual,
+                               cx, cy + 28, font - 3, seasonal % (wet, dry)))
+        else:
+            cx, cy = geom["cx"], geom["cy"]
+            yield small_fmt((name, cx, cy, geom["r"], cls, cx, cy + 5, code, annual))
+
+def _vulnerability_bubbles():
+    """Yield the vulnerability scatter bubbles"""
+    
+    bubble_fmt = VULN_BUBBLE_TMPL.__mod__
+    classes = VULN_CLASSES[VULN_ORDER]
+    records = zip(NAMES[VULN_ORDER].tolist(), VULN_X[VULN_ORDER].tolist(), VULN_Y[VULN_ORDER].tolist(),
+                  VULN_R[VULN_ORDER].tolist(), VULN_FILLS[classes].tolist(), VULN_STROKES[classes].tolist(),
+                  VULN_TEXT_COLORS[classes].tolist(), CODES[VULN_ORDER].tolist(), VULN[VULN_ORDER].tolist())
+    
+    for name, x, y, r, fill, stroke, text_color, code, vuln in records:
+        yield bubble_fmt((name, x, y, r, fill, stroke, text_color, code, text_color, vuln))
+
+# Geometry and data are both fixed at import, so the per-country fragments are
+# fully evaluated once here; the map generators just yield the result
+_TEMP_COUNTRIES = "".join(_temperature_countries())
+_PRECIP_COUNTRIES = "".join(_precipitation_countries())
+_VULN_BUBBLES = "".join(_vulnerability_bubbles())
+_VULN_QUADRANTS = "".join(QUADRANT_LABEL_TMPL % row for row in VULN_QUADRANTS)
+
+def _vulnerability_legend():
+    """Build the vulnerability legend entries, most vulnerable class first"""
+    
+    ranges = ["&lt; %.2f" % VULN_BINS[0],
+              *("%.2f-%.2f" % pair for pair in zip(VULN_BINS[:-1], VULN_BINS[1:])),
+              "&gt; %.2f" % VULN_BINS[-1]]
+    entries = zip(ranges[::-1], VULN_LEVELS[::-1], VULN_FILLS[::-1].tolist(), VULN_STROKES[::-1].tolist())
+    return "    \n".join(VULN_LEGEND_ENTRY_TMPL % (20 + 30 * i, fill, stroke, 25 + 30 * i,
+                                                   "%s (%s)" % (span, level))
+                         for i, (span, level, fill, stroke) in enumerate(entries))
+
+_VULN_LEGEND = _vulnerability_legend()
+
+def _risk_grid():
+    """Build the risk-matrix grid lines and zone fills, one path per colour"""
+    
+    rows, cols = RISK_ZONE_COLORS.shape
+    cell_w, cell_h = RISK_MATRIX_WIDTH // cols, RISK_MATRIX_HEIGHT // rows
+    grid = ("".join("M0 %dH%d" % (r * cell_h, RISK_MATRIX_WIDTH) for r in range(1, rows))
+            + "".join("M%d 0V%d" % (c * cell_w, RISK_MATRIX_HEIGHT) for c in range(1, cols)))
+    
+    cells = {}
+    for r in range(rows):
+        for c in range(cols):
+            cells.setdefault(RISK_ZONE_COLORS[r, c], []).append(
+                "M%d %dh%dv%dh-%dz" % (c * cell_w, r * cell_h, cell_w, cell_h, cell_w))
+    zones = "".join('    <path d="%s" fill="%s" fill-opacity="0.3"/>\n' % ("".join(d), color)
+                    for color, d in cells.items())
+    return '    <path d="%s" stroke="#cccccc" stroke-width="1"/>\n' % grid, zones
+
+_RISK_GRID, _RISK_ZONES = _risk_grid()
+
+def _axis_labels(xs, ys, attrs, labels):
+    """Build one <text> per axis tick; the four columns broadcast against each other"""
+    columns = np.broadcast_arrays(xs, ys, attrs, labels)
+    return "".join(AXIS_LABEL_TMPL % row for row in zip(*(column.tolist() for column in columns)))
+
+_TEMPORAL_YEAR_LABELS = _axis_labels(
+    TEMPORAL_X, TEMPORAL_PLOT_HEIGHT + 30,
+    np.where(TEMPORAL_YEARS == TEMPORAL_PRESENT, 'class="s12 b m c"', 'class="s12 m c"'),
+    np.char.mod("%d", TEMPORAL_YEARS))
+_TEMPORAL_TEMP_LABELS = _axis_labels(
+    -20, TEMPORAL_TEMP_Y + 5, 'class="s12 e c"',
+    np.where(TEMPORAL_TEMPS == 0, "0°C", np.char.mod("%+d°C", TEMPORAL_TEMPS)))
+_TEMPORAL_PRECIP_LABELS = _axis_labels(
+    TEMPORAL_PLOT_WIDTH + 20, TEMPORAL_PRECIP_Y + 5, 'class="s12" fill="#8c510a"',
+    np.char.mod("%d%%", TEMPORAL_PRECIP))
+_TIMELINE_TICKS = '    <path d="%s" stroke="#333333" stroke-width="2"/>\n' % "".join(
+    "M%d 95V105" % x for x in TIMELINE_X.tolist())
+_TIMELINE_LABELS = _axis_labels(TIMELINE_X, 125, 'class="s12 m c"', np.char.mod("%d", TIMELINE_YEARS))
+
+def _trend(start, rate, accel, years, base_year):
+    """Evaluate start + rate*t + accel*t**2 for t in decades since base_year"""
+    decades = (np.asarray(years) - base_year) / 10
+    return start + rate * decades + accel * decades ** 2
+
+def _path_data(xs, ys):
+    """Build SVG path data for a polyline through the points, to 0.1px"""
+    points = zip(np.round(xs, 1).tolist(), np.round(ys, 1).tolist())
+    return "M" + "L".join("%g %g" % point for point in points)
+
+def _temporal_trends():
+    """Build the observed and projected temperature and precipitation curves"""
+    
+    observed_x = TEMPORAL_X[:len(TEMPORAL_OBSERVED_TEMP)]
+    projected_x = np.interp(TEMPORAL_PROJECTION_YEARS, TEMPORAL_SPAN, (0, TEMPORAL_PLOT_WIDTH))
+    
+    # Temperatures rise from the plot bottom; all scenarios share one trend
+    # evaluation as a (scenarios, years) array
+    coefs = np.array([scenario[1:3] for scenario in TEMPORAL_SCENARIOS])
+    projected_temp = _trend(TEMPORAL_OBSERVED_TEMP[-1], coefs[:, :1], coefs[:, 1:],
+                            TEMPORAL_PROJECTION_YEARS, TEMPORAL_PRESENT)
+    scenario_y = TEMPORAL_PLOT_HEIGHT - TEMPORAL_TEMP_SCALE * projected_temp
+    scenarios = "".join(SCENARIO_CURVE_TMPL % (label, _path_data(projected_x, ys), color, dash)
+                        for (label, _, _, color, dash), ys in zip(TEMPORAL_SCENARIOS, scenario_y))
+    
+    projected_precip = _trend(TEMPORAL_OBSERVED_PRECIP[-1], *TEMPORAL_PRECIP_TREND,
+                              TEMPORAL_PROJECTION_YEARS, TEMPORAL_PRESENT)
+    observed_precip_y = TEMPORAL_PRECIP_ZERO - TEMPORAL_PRECIP_SCALE * TEMPORAL_OBSERVED_PRECIP
+    projected_precip_y = TEMPORAL_PRECIP_ZERO - TEMPORAL_PRECIP_SCALE * projected_precip
+    
+    return TEMPORAL_TRENDS_TMPL % (
+        _path_data(observed_x, TEMPORAL_PLOT_HEIGHT - TEMPORAL_TEMP_SCALE * TEMPORAL_OBSERVED_TEMP),
+        scenarios, _path_data(observed_x, observed_precip_y), _path_data(projected_x, projected_precip_y))
+
+def _timeline_trends():
+    """Build the integrated diagram's risk progression curves and their labels"""
+    
+    years = np.linspace(TIMELINE_YEARS[0], TIMELINE_YEARS[-1], 21)
+    xs = np.interp(years, TIMELINE_YEARS[[0, -1]], TIMELINE_X[[0, -1]])
+    curves = []
+    for label, level, rate, accel, color in TIMELINE_TRENDS:
+        ys = TIMELINE_AXIS_Y - _trend(level, rate, accel, years, TIMELINE_YEARS[0])
+        curves.append(TIMELINE_TREND_TMPL % (_path_data(xs, ys), color, round(ys[-1]) + 5, color, label))
+    return "".join(curves)
+
+_TEMPORAL_TRENDS = _temporal_trends()
+_TIMELINE_TRENDS = _timeline_trends()
+
+# Chrome shared by the three maps: svg root, label styles, background, title
+# and subtitle, followed by the map-specific fragments and a closing </svg>.
+# The classes replace the text attributes repeated on every country label
+_MAP_HEADER = Template('''<svg width="1200" height="$height" xmlns="http://www.w3.org/2000/svg" font-family="Arial">
+  <style>
+    .lbl { font-weight: bold; text-anchor: middle; fill: #2c3e50 }
+    .val { font-weight: bold; text-anchor: middle }
+    .det { text-anchor: middle; fill: #5a6c7d }
+    .sm { font-size: 10px; font-weight: bold; text-anchor: middle; fill: #2c3e50 }
+    .code { font-size: 14px; font-weight: bold; text-anchor: middle }
+    .score { font-size: 11px; text-anchor: middle }
+  </style>
+  <!-- Title and Background -->
+  <rect width="1200" height="$height" fill="#f8f9fa"/>
+  
+  <!-- Title -->
+  <text x="600" y="40" font-family="Arial, sans-serif" font-size="24" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    $title
+  </text>
+  <text x="600" y="65" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
+    $subtitle
+  </text>
+  
+''')
+
+# Chrome shared by the integrated risk and temporal diagrams. As on the maps,
+# the font is inherited from the root and the text attributes repeated on
+# nearly every label are classes: size, bold, italic, middle/end anchor and
+# the default text colour
+_DIAGRAM_HEADER = Template('''<svg width="$width" height="$height" xmlns="http://www.w3.org/2000/svg" font-family="Arial">
+  <style>
+    .s10 { font-size: 10px } .s11 { font-size: 11px } .s12 { font-size: 12px } .s13 { font-size: 13px }
+    .s14 { font-size: 14px } .s16 { font-size: 16px } .s18 { font-size: 18px }
+    .b { font-weight: bold } .i { font-style: italic }
+    .m { text-anchor: middle } .e { text-anchor: end }
+    .c { fill: #2c3e50 }
+  </style>
+  <!-- Background -->
+  <rect width="$width" height="$height" fill="#f8f9fa"/>
+  
+  <!-- Title -->
+  <text x="$center" y="35" font-family="Arial, sans-serif" font-size="$title_size" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    $title
+  </text>
+  <text x="$center" y="60" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
+    $subtitle
+  </text>
+  
+''')
+
+def _input_hash(*tables):
+    """Hash the input tables together with this module's source"""
+    digest = hashlib.blake2b(Path(__file__).read_bytes())
+    for table in tables:
+        digest.update(json.dumps(table, sort_keys=True).encode())
+    return digest.hexdigest()
+
+def _is_up_to_date(svg_file, key):
+    """True if svg_file and its .svgz exist and were generated from inputs hashing to key"""
+    hash_file = Path(svg_file + ".hash")
+    return (Path(svg_file).exists() and Path(svg_file + "z").exists()
+            and hash_file.exists() and hash_file.read_text() == key)
+
+def _cached_svg(svg_file, *tables):
+    """Turn an SVG fragment generator into a create function that writes svg_file
+    
+    The output is skipped when svg_file is up to date with the hash of tables
+    and this module's source. Tables defined as literals in this module are
+    covered by the source hash and need not be listed.
+    """
+    def decorator(fragments):
+        @functools.wraps(fragments)
+        def create():
+            key = _input_hash(*tables)
+            if _is_up_to_date(svg_file, key):
+                print(f"Up to date: {svg_file}")
+                return
+            if _write_svg(svg_file, fragments(), key):
+                print(f"Created: {svg_file} (+ {svg_file}z)")
+            else:
+                print(f"Unchanged: {svg_file}")
+        return create
+    return decorator
+
+# Whitespace between tags (including at fragment edges next to a tag) and
+# line breaks between the attributes of a tag. Text node content is left alone
+_INTER_TAG_SPACE = re.compile(r"(?:(?<=>)|\A)\s+(?=<|\Z)")
+_ATTRIBUTE_BREAK = re.compile(r"\s*\n\s*(?=[\w:-]+=\")")
+
+def _minify(fragment):
+    """Strip the layout whitespace from an SVG fragment"""
+    return _ATTRIBUTE_BREAK.sub(" ", _INTER_TAG_SPACE.sub("", fragment))
+
+def _write_svg(svg_file, fragments, key):
+    """Stream SVG fragments to the file and a gzipped .svgz copy, then record the input hash
+
+    Fragments are minified, encoded and written as they are produced, so the
+    full document is never held in memory. Each output is well under the
+    64 KiB buffer, so the per-fragment writes still reach the kernel as a
+    single write per file. The outputs are static assets, so
+    the .svgz uses maximum compression and a zero timestamp, which keeps it
+    byte-identical across regenerations from the same inputs.
+    
+    The same bytes are fed to an expat parser, so a template slip that breaks
+    well-formedness raises here instead of surfacing in Figma; the hash is
+    then not recorded and the next run regenerates the file.
+    
+    Both outputs are written to temporary files first and only moved into
+    place if the SVG differs from the existing one. Editing one map changes
+    the module hash and so regenerates them all, but the unchanged ones keep
+    their files (and modification times) as they were. Returns True if the
+    outputs were replaced.
+    """
+    parser = expat.ParserCreate()
+    digest = hashlib.blake2b(digest_size=8)
+    svg_path, svgz_path = Path(svg_file), Path(svg_file + "z")
+    svg_tmp, svgz_tmp = Path(svg_file + ".tmp"), Path(svg_file + "z.tmp")
+    try:
+        with open(svg_tmp, "wb", buffering=1 << 16) as out, \
+                open(svgz_tmp, "wb") as out_raw, \
+                gzip.GzipFile(fileobj=out_raw, mode="wb", compresslevel=9, mtime=0) as out_gz:
+            for fragment in fragments:
+                data = _minify(fragment).encode("utf-8")
+                parser.Parse(data, False)
+                digest.update(data)
+                out.write(data)
+                out_gz.write(data)
+            parser.Parse(b"", True)
+        changed = not (svg_path.exists() and svgz_path.exists()
+                       and hashlib.blake2b(svg_path.read_bytes(), digest_size=8).digest() == digest.digest())
+        if changed:
+            svg_tmp.replace(svg_path)
+            svgz_tmp.replace(svgz_path)
+    except expat.ExpatError as e:
+        raise ValueError(f"{svg_file} is not well-formed SVG: {e}") from e
+    finally:
+        svg_tmp.unlink(missing_ok=True)
+        svgz_tmp.unlink(missing_ok=True)
+    Path(svg_file + ".hash").write_text(key)
+    return changed
+
+@_cached_svg("southern_africa_temperature_anomaly.svg", SOUTHERN_AFRICA_DATA, COUNTRY_GEOM)
+def create_temperature_anomaly_map():
+    """Create SVG map showing temperature anomalies across Southern Africa"""
+    
+    yield _MAP_HEADER.substitute(height=800, title="Southern Africa Temperature Anomaly (°C above 1961-1990 baseline)",
+                                 subtitle="Observed warming 1991-2020 with projected increase by 2050 (SSP2-4.5)")
+    yield '''  <!-- Map Container -->
+  <g transform="translate(100, 100)">
+    <!-- Simplified country shapes with temperature gradient fills -->
+    
+'''
+    
+    yield _TEMP_COUNTRIES
+    
+    yield '''  </g>
   
   <!-- Temperature Scale Legend -->
   <g transform="translate(950, 300)">
-    <text x="0" y="-10" font-family="Arial" font-size="14" font-weight="bold" fill="#2c3e50">Temperature Anomaly</text>
+    <text x="0" y="-10" font-size="14" font-weight="bold" fill="#2c3e50">Temperature Anomaly</text>
     <rect x="0" y="0" width="40" height="20" fill="#a50026"/>
-    <text x="50" y="15" font-family="Arial" font-size="12" fill="#2c3e50">&gt;1.5°C</text>
+    <text x="50" y="15" font-size="12" fill="#2c3e50">&gt;1.5°C</text>
     
     <rect x="0" y="25" width="40" height="20" fill="#d73027"/>
-    <text x="50" y="40" font-family="Arial" font-size="12" fill="#2c3e50">1.3-1.5°C</text>
+    <text x="50" y="40" font-size="12" fill="#2c3e50">1.3-1.5°C</text>
     
     <rect x="0" y="50" width="40" height="20" fill="#f46d43"/>
-    <text x="50" y="65" font-family="Arial" font-size="12" fill="#2c3e50">1.1-1.3°C</text>
+    <text x="50" y="65" font-size="12" fill="#2c3e50">1.1-1.3°C</text>
     
     <rect x="0" y="75" width="40" height="20" fill="#fdae61"/>
-    <text x="50" y="90" font-family="Arial" font-size="12" fill="#2c3e50">0.9-1.1°C</text>
+    <text x="50" y="90" font-size="12" fill="#2c3e50">0.9-1.1°C</text>
     
     <rect x="0" y="100" width="40" height="20" fill="#fee090"/>
-    <text x="50" y="115" font-family="Arial" font-size="12" fill="#2c3e50">&lt;0.9°C</text>
+    <text x="50" y="115" font-size="12" fill="#2c3e50">&lt;0.9°C</text>
   </g>
   
   <!-- Projected 2050 Warming -->
   <g transform="translate(100, 650)">
     <rect x="0" y="0" width="900" height="80" fill="#fff7ec" stroke="#d73027" stroke-width="2" rx="5"/>
-    <text x="450" y="25" font-family="Arial" font-size="16" font-weight="bold" text-anchor="middle" fill="#d73027">
+    <text x="450" y="25" font-size="16" font-weight="bold" text-anchor="middle" fill="#d73027">
       Projected Additional Warming by 2050 (SSP2-4.5)
     </text>
-    <text x="450" y="50" font-family="Arial" font-size="14" text-anchor="middle" fill="#2c3e50">
+    <text x="450" y="50" font-size="14" text-anchor="middle" fill="#2c3e50">
       Expected additional +1.2-1.8°C across the region, with interior areas warming faster
     </text>
-    <text x="450" y="70" font-family="Arial" font-size="12" text-anchor="middle" fill="#5a6c7d">
+    <text x="450" y="70" font-size="12" text-anchor="middle" fill="#5a6c7d">
       Total warming from pre-industrial: 2.5-3.5°C by mid-century
     </text>
   </g>
   
   <!-- Gradient Definitions -->
-  <defs>
-    <linearGradient id="tempGradientZAF" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#d73027;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#f46d43;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientNAM" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#a50026;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#d73027;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientBWA" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#d73027;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#f46d43;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientZWE" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#f46d43;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#fdae61;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientMOZ" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#fdae61;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#fee090;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientZMB" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#f46d43;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#fdae61;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientAGO" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#f46d43;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#fdae61;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientMWI" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#fdae61;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#fee090;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientMDG" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#fee090;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#f7f7f7;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientLSO" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#a50026;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#d73027;stop-opacity:0.8" />
-    </linearGradient>
-    <linearGradient id="tempGradientSWZ" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#d73027;stop-opacity:0.8" />
-      <stop offset="100%" style="stop-color:#f46d43;stop-opacity:0.8" />
-    </linearGradient>
-  </defs>
-</svg>'''
+'''
     
-    with open("southern_africa_temperature_anomaly.svg", "w") as f:
-        f.write(svg_content)
-    print("Created: southern_africa_temperature_anomaly.svg")
+    yield _TEMP_DEFS
+    yield "</svg>"
 
+@_cached_svg("southern_africa_precipitation_change.svg", SOUTHERN_AFRICA_DATA, PRECIPITATION_DATA,
+             COUNTRY_GEOM)
 def create_precipitation_change_map():
     """Create SVG map showing precipitation changes across Southern Africa"""
     
-    svg_content = '''<svg width="1200" height="800" xmlns="http://www.w3.org/2000/svg">
-  <!-- Title and Background -->
-  <rect width="1200" height="800" fill="#f8f9fa"/>
-  
-  <!-- Title -->
-  <text x="600" y="40" font-family="Arial, sans-serif" font-size="24" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-    Southern Africa Precipitation Change (% from 1991-2020 baseline)
-  </text>
-  <text x="600" y="65" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
-    Observed drying trends with seasonal variation patterns
-  </text>
-  
-  <!-- Map Container -->
+    yield _MAP_HEADER.substitute(height=800, title="Southern Africa Precipitation Change (% from 1991-2020 baseline)",
+                                 subtitle="Observed drying trends with seasonal variation patterns")
+    yield '''  <!-- Map Container -->
   <g transform="translate(100, 100)">
     
-    <!-- South Africa -->
-    <g>
-      <path d="M 400 400 L 550 380 L 600 420 L 580 480 L 500 500 L 400 480 Z" 
-            fill="url(#precipGradientZAF)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="500" y="440" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        South Africa
-      </text>
-      <text x="500" y="460" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#8c510a">
-        -11%
-      </text>
-      <text x="500" y="478" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -14% | Dry: -8%
-      </text>
-    </g>
+'''
     
-    <!-- Namibia -->
-    <g>
-      <path d="M 250 300 L 350 280 L 380 400 L 300 420 L 250 380 Z" 
-            fill="url(#precipGradientNAM)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="315" y="340" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Namibia
-      </text>
-      <text x="315" y="360" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#543005">
-        -15%
-      </text>
-      <text x="315" y="378" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -18% | Dry: -10%
-      </text>
-    </g>
-    
-    <!-- Botswana -->
-    <g>
-      <path d="M 380 300 L 480 290 L 500 380 L 400 400 L 380 350 Z" 
-            fill="url(#precipGradientBWA)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="440" y="330" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Botswana
-      </text>
-      <text x="440" y="350" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#8c510a">
-        -12%
-      </text>
-      <text x="440" y="368" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -15% | Dry: -8%
-      </text>
-    </g>
+    yield _PRECIP_COUNTRIES
     
-    <!-- Zimbabwe -->
-    <g>
-      <path d="M 500 280 L 580 270 L 600 340 L 520 360 L 500 320 Z" 
-            fill="url(#precipGradientZWE)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="550" y="305" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Zimbabwe
-      </text>
-      <text x="550" y="325" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#bf812d">
-        -10%
-      </text>
-      <text x="550" y="343" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -13% | Dry: -7%
-      </text>
-    </g>
-    
-    <!-- Mozambique -->
-    <g>
-      <path d="M 600 270 L 680 250 L 700 450 L 620 470 L 600 420 Z" 
-            fill="url(#precipGradientMOZ)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="650" y="350" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Mozambique
-      </text>
-      <text x="650" y="370" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#dfc27d">
-        -6%
-      </text>
-      <text x="650" y="388" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -8% | Dry: -3%
-      </text>
-    </g>
-    
-    <!-- Zambia -->
-    <g>
-      <path d="M 480 200 L 580 190 L 600 270 L 500 280 L 480 240 Z" 
-            fill="url(#precipGradientZMB)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="540" y="230" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Zambia
-      </text>
-      <text x="540" y="250" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#bf812d">
-        -9%
-      </text>
-      <text x="540" y="268" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -11% | Dry: -6%
-      </text>
-    </g>
-    
-    <!-- Angola -->
-    <g>
-      <path d="M 300 100 L 480 80 L 500 200 L 380 220 L 300 180 Z" 
-            fill="url(#precipGradientAGO)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="400" y="145" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Angola
-      </text>
-      <text x="400" y="165" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#dfc27d">
-        -5%
-      </text>
-      <text x="400" y="183" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -8% | Dry: -2%
-      </text>
-    </g>
-    
-    <!-- Malawi -->
-    <g>
-      <path d="M 620 240 L 650 230 L 660 340 L 630 350 L 620 300 Z" 
-            fill="url(#precipGradientMWI)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="640" y="280" font-family="Arial" font-size="12" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Malawi
-      </text>
-      <text x="640" y="298" font-family="Arial" font-size="16" font-weight="bold" text-anchor="middle" fill="#dfc27d">
-        -7%
-      </text>
-      <text x="640" y="314" font-family="Arial" font-size="10" text-anchor="middle" fill="#5a6c7d">
-        W:-9% | D:-4%
-      </text>
-    </g>
-    
-    <!-- Madagascar -->
-    <g>
-      <path d="M 780 250 L 820 240 L 840 450 L 800 460 L 780 350 Z" 
-            fill="url(#precipGradientMDG)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="810" y="340" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        Madagascar
-      </text>
-      <text x="810" y="360" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#f6e8c3">
-        -3%
-      </text>
-      <text x="810" y="378" font-family="Arial" font-size="11" text-anchor="middle" fill="#5a6c7d">
-        Wet: -5% | Dry: +2%
-      </text>
-    </g>
-    
-    <!-- Lesotho -->
-    <g>
-      <circle cx="520" cy="460" r="25" fill="url(#precipGradientLSO)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="520" y="465" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        LSO -10%
-      </text>
-    </g>
-    
-    <!-- Eswatini -->
-    <g>
-      <circle cx="570" cy="440" r="20" fill="url(#precipGradientSWZ)" stroke="#2c3e50" stroke-width="2" opacity="0.85"/>
-      <text x="570" y="445" font-family="Arial" font-size="10" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-        SWZ -8%
-      </text>
-    </g>
-  </g>
+    yield '''  </g>
   
   <!-- Precipitation Change Legend -->
   <g transform="translate(950, 300)">
-    <text x="0" y="-10" font-family="Arial" font-size="14" font-weight="bold" fill="#2c3e50">Precipitation Change</text>
+    <text x="0" y="-10" font-size="14" font-weight="bold" fill="#2c3e50">Precipitation Change</text>
     <rect x="0" y="0" width="40" height="20" fill="#543005"/>
-    <text x="50" y="15" font-family="Arial" font-size="12" fill="#2c3e50">&lt; -15%</text>
+    <text x="50" y="15" font-size="12" fill="#2c3e50">&lt; -15%</text>
     
     <rect x="0" y="25" width="40" height="20" fill="#8c510a"/>
-    <text x="50" y="40" font-family="Arial" font-size="12" fill="#2c3e50">-10 to -15%</text>
+    <text x="50" y="40" font-size="12" fill="#2c3e50">-10 to -15%</text>
     
     <rect x="0" y="50" width="40" height="20" fill="#bf812d"/>
-    <text x="50" y="65" font-family="Arial" font-size="12" fill="#2c3e50">-7 to -10%</text>
+    <text x="50" y="65" font-size="12" fill="#2c3e50">-7 to -10%</text>
     
     <rect x="0" y="75" width="40" height="20" fill="#dfc27d"/>
-    <text x="50" y="90" font-family="Arial" font-size="12" fill="#2c3e50">-4 to -7%</text>
+    <text x="50" y="90" font-size="12" fill="#2c3e50">-4 to -7%</text>
     
     <rect x="0" y="100" width="40" height="20" fill="#f6e8c3"/>
-    <text x="50" y="115" font-family="Arial" font-size="12" fill="#2c3e50">&gt; -4%</text>
+    <text x="50" y="115" font-size="12" fill="#2c3e50">&gt; -4%</text>
   </g>
   
   <!-- Seasonal Pattern Box -->
   <g transform="translate(100, 650)">
     <rect x="0" y="0" width="900" height="80" fill="#f5f5f5" stroke="#8c510a" stroke-width="2" rx="5"/>
-    <text x="450" y="25" font-family="Arial" font-size="16" font-weight="bold" text-anchor="middle" fill="#8c510a">
+    <text x="450" y="25" font-size="16" font-weight="bold" text-anchor="middle" fill="#8c510a">
       Key Precipitation Patterns
     </text>
-    <text x="450" y="50" font-family="Arial" font-size="14" text-anchor="middle" fill="#2c3e50">
+    <text x="450" y="50" font-size="14" text-anchor="middle" fill="#2c3e50">
       • Wet season showing stronger decline (-8 to -18%) than dry season (-2 to -10%)
     </text>
-    <text x="450" y="70" font-family="Arial" font-size="14" text-anchor="middle" fill="#2c3e50">
+    <text x="450" y="70" font-size="14" text-anchor="middle" fill="#2c3e50">
       • Southwest (Namibia, W. South Africa) experiencing most severe drying
     </text>
   </g>
   
   <!-- Gradient Definitions -->
-  <defs>
-    <!-- Each gradient reflects precipitation change severity -->
-    <linearGradient id="precipGradientNAM" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#543005;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#8c510a;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientBWA" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#8c510a;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#bf812d;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientZAF" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#8c510a;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#bf812d;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientZWE" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#bf812d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientZMB" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#bf812d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientAGO" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#f6e8c3;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientMOZ" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#f6e8c3;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientMWI" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#f6e8c3;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientMDG" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#f6e8c3;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#f5f5f5;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientLSO" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#bf812d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-    </linearGradient>
-    <linearGradient id="precipGradientSWZ" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#dfc27d;stop-opacity:0.7" />
-      <stop offset="100%" style="stop-color:#f6e8c3;stop-opacity:0.7" />
-    </linearGradient>
-  </defs>
-</svg>'''
+'''
     
-    with open("southern_africa_precipitation_change.svg", "w") as f:
-        f.write(svg_content)
-    print("Created: southern_africa_precipitation_change.svg")
+    yield _PRECIP_DEFS
+    yield "</svg>"
 
+@_cached_svg("southern_africa_vulnerability_index.svg", SOUTHERN_AFRICA_DATA)
 def create_vulnerability_index_map():
     """Create SVG map showing ND-GAIN vulnerability indices"""
     
-    svg_content = '''<svg width="1200" height="900" xmlns="http://www.w3.org/2000/svg">
-  <!-- Title and Background -->
-  <rect width="1200" height="900" fill="#f8f9fa"/>
-  
-  <!-- Title -->
-  <text x="600" y="40" font-family="Arial, sans-serif" font-size="24" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-    Southern Africa Climate Vulnerability Index (ND-GAIN 2023)
-  </text>
-  <text x="600" y="65" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
-    Combining exposure, sensitivity, and adaptive capacity indicators
-  </text>
-  
-  <!-- Main visualization with bubbles sized by vulnerability -->
+    yield _MAP_HEADER.substitute(height=900, title="Southern Africa Climate Vulnerability Index (ND-GAIN 2023)",
+                                 subtitle="Combining exposure, sensitivity, and adaptive capacity indicators")
+    yield '''  <!-- Main visualization with bubbles sized by vulnerability -->
   <g transform="translate(150, 120)">
     
     <!-- Vulnerability vs Readiness scatter plot background -->
@@ -551,383 +777,194 @@ def create_vulnerability_index_map():
     <line x1="300" y1="0" x2="300" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
     
     <!-- Axis labels -->
-    <text x="300" y="430" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    <text x="300" y="430" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
       Readiness to Adapt →
     </text>
-    <text x="-200" y="-30" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50" transform="rotate(-90)">
+    <text x="-200" y="-30" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50" transform="rotate(-90)">
       Vulnerability →
     </text>
     
     <!-- Countries positioned by vulnerability and readiness -->
     
-    <!-- Mozambique - High vulnerability, Low readiness -->
-    <g transform="translate(180, 80)">
-      <circle r="45" fill="#d73027" fill-opacity="0.7" stroke="#8b0000" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MOZ</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="white">0.571</text>
-    </g>
-    
-    <!-- Madagascar - High vulnerability, Low readiness -->
-    <g transform="translate(200, 90)">
-      <circle r="44" fill="#d73027" fill-opacity="0.7" stroke="#8b0000" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MDG</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="white">0.564</text>
-    </g>
-    
-    <!-- Angola - High vulnerability, Low readiness -->
-    <g transform="translate(190, 110)">
-      <circle r="42" fill="#f46d43" fill-opacity="0.7" stroke="#d73027" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">AGO</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="white">0.551</text>
-    </g>
-    
-    <!-- Malawi - High vulnerability, Low-mid readiness -->
-    <g transform="translate(250, 115)">
-      <circle r="41" fill="#f46d43" fill-opacity="0.7" stroke="#d73027" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MWI</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="white">0.548</text>
-    </g>
-    
-    <!-- Zambia - Mid-high vulnerability, Mid readiness -->
-    <g transform="translate(265, 140)">
-      <circle r="40" fill="#fdae61" fill-opacity="0.7" stroke="#f46d43" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">ZMB</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.532</text>
-    </g>
-    
-    <!-- Zimbabwe - Mid-high vulnerability, Low readiness -->
-    <g transform="translate(195, 155)">
-      <circle r="39" fill="#fdae61" fill-opacity="0.7" stroke="#f46d43" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">ZWE</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.523</text>
-    </g>
-    
-    <!-- Lesotho - Mid vulnerability, Mid readiness -->
-    <g transform="translate(265, 190)">
-      <circle r="37" fill="#fee090" fill-opacity="0.7" stroke="#fdae61" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">LSO</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.485</text>
-    </g>
-    
-    <!-- Eswatini - Mid vulnerability, Mid readiness -->
-    <g transform="translate(290, 210)">
-      <circle r="36" fill="#fee090" fill-opacity="0.7" stroke="#fdae61" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">SWZ</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.471</text>
-    </g>
-    
-    <!-- Namibia - Lower vulnerability, Higher readiness -->
-    <g transform="translate(350, 240)">
-      <circle r="35" fill="#e0f3f8" fill-opacity="0.7" stroke="#91bfdb" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">NAM</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.456</text>
-    </g>
-    
-    <!-- Botswana - Lower vulnerability, Higher readiness -->
-    <g transform="translate(380, 260)">
-      <circle r="34" fill="#abd9e9" fill-opacity="0.7" stroke="#74add1" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">BWA</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="#2c3e50">0.438</text>
-    </g>
-    
-    <!-- South Africa - Lowest vulnerability, Highest readiness -->
-    <g transform="translate(360, 290)">
-      <circle r="33" fill="#74add1" fill-opacity="0.7" stroke="#4575b4" stroke-width="2"/>
-      <text y="0" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">ZAF</text>
-      <text y="15" font-family="Arial" font-size="11" text-anchor="middle" fill="white">0.422</text>
-    </g>
-    
-    <!-- Quadrant labels -->
-    <text x="150" y="100" font-family="Arial" font-size="12" font-style="italic" text-anchor="middle" fill="#d73027">
-      High Risk
-    </text>
-    <text x="150" y="115" font-family="Arial" font-size="11" text-anchor="middle" fill="#d73027">
-      (High Vuln, Low Ready)
-    </text>
+'''
     
-    <text x="450" y="100" font-family="Arial" font-size="12" font-style="italic" text-anchor="middle" fill="#fdae61">
-      Moderate Risk
-    </text>
-    <text x="450" y="115" font-family="Arial" font-size="11" text-anchor="middle" fill="#fdae61">
-      (High Vuln, High Ready)
-    </text>
+    yield _VULN_BUBBLES
     
-    <text x="150" y="350" font-family="Arial" font-size="12" font-style="italic" text-anchor="middle" fill="#fee090">
-      Building Resilience
-    </text>
-    <text x="150" y="365" font-family="Arial" font-size="11" text-anchor="middle" fill="#fee090">
-      (Low Vuln, Low Ready)
-    </text>
-    
-    <text x="450" y="350" font-family="Arial" font-size="12" font-style="italic" text-anchor="middle" fill="#74add1">
-      Most Prepared
-    </text>
-    <text x="450" y="365" font-family="Arial" font-size="11" text-anchor="middle" fill="#74add1">
-      (Low Vuln, High Ready)
-    </text>
-  </g>
+    yield '''    <!-- Quadrant labels -->
+'''
+    yield _VULN_QUADRANTS
+    yield '''  </g>
   
   <!-- Vulnerability Components -->
   <g transform="translate(850, 150)">
-    <text x="0" y="0" font-family="Arial" font-size="16" font-weight="bold" fill="#2c3e50">Vulnerability Components</text>
-    
-    <text x="0" y="30" font-family="Arial" font-size="13" font-weight="bold" fill="#d73027">Exposure</text>
-    <text x="0" y="50" font-family="Arial" font-size="11" fill="#5a6c7d">• Projected climate change</text>
-    <text x="0" y="68" font-family="Arial" font-size="11" fill="#5a6c7d">• Climate variability</text>
-    
-    <text x="0" y="100" font-family="Arial" font-size="13" font-weight="bold" fill="#f46d43">Sensitivity</text>
-    <text x="0" y="120" font-family="Arial" font-size="11" fill="#5a6c7d">• Food security</text>
-    <text x="0" y="138" font-family="Arial" font-size="11" fill="#5a6c7d">• Water resources</text>
-    <text x="0" y="156" font-family="Arial" font-size="11" fill="#5a6c7d">• Health systems</text>
-    <text x="0" y="174" font-family="Arial" font-size="11" fill="#5a6c7d">• Ecosystem services</text>
-    <text x="0" y="192" font-family="Arial" font-size="11" fill="#5a6c7d">• Human habitat</text>
-    <text x="0" y="210" font-family="Arial" font-size="11" fill="#5a6c7d">• Infrastructure</text>
-    
-    <text x="0" y="242" font-family="Arial" font-size="13" font-weight="bold" fill="#74add1">Adaptive Capacity</text>
-    <text x="0" y="262" font-family="Arial" font-size="11" fill="#5a6c7d">• Economic readiness</text>
-    <text x="0" y="280" font-family="Arial" font-size="11" fill="#5a6c7d">• Governance readiness</text>
-    <text x="0" y="298" font-family="Arial" font-size="11" fill="#5a6c7d">• Social readiness</text>
+    <text x="0" y="0" font-size="16" font-weight="bold" fill="#2c3e50">Vulnerability Components</text>
+    
+    <text x="0" y="30" font-size="13" font-weight="bold" fill="#d73027">Exposure</text>
+    <text x="0" y="50" font-size="11" fill="#5a6c7d">• Projected climate change</text>
+    <text x="0" y="68" font-size="11" fill="#5a6c7d">• Climate variability</text>
+    
+    <text x="0" y="100" font-size="13" font-weight="bold" fill="#f46d43">Sensitivity</text>
+    <text x="0" y="120" font-size="11" fill="#5a6c7d">• Food security</text>
+    <text x="0" y="138" font-size="11" fill="#5a6c7d">• Water resources</text>
+    <text x="0" y="156" font-size="11" fill="#5a6c7d">• Health systems</text>
+    <text x="0" y="174" font-size="11" fill="#5a6c7d">• Ecosystem services</text>
+    <text x="0" y="192" font-size="11" fill="#5a6c7d">• Human habitat</text>
+    <text x="0" y="210" font-size="11" fill="#5a6c7d">• Infrastructure</text>
+    
+    <text x="0" y="242" font-size="13" font-weight="bold" fill="#74add1">Adaptive Capacity</text>
+    <text x="0" y="262" font-size="11" fill="#5a6c7d">• Economic readiness</text>
+    <text x="0" y="280" font-size="11" fill="#5a6c7d">• Governance readiness</text>
+    <text x="0" y="298" font-size="11" fill="#5a6c7d">• Social readiness</text>
   </g>
   
   <!-- Legend -->
   <g transform="translate(850, 380)">
-    <text x="0" y="0" font-family="Arial" font-size="14" font-weight="bold" fill="#2c3e50">Vulnerability Index</text>
+    <text x="0" y="0" font-size="14" font-weight="bold" fill="#2c3e50">Vulnerability Index</text>
     
-    <circle cx="20" cy="20" r="15" fill="#d73027" fill-opacity="0.7" stroke="#8b0000" stroke-width="1"/>
-    <text x="45" y="25" font-family="Arial" font-size="12" fill="#2c3e50">&gt; 0.55 (Very High)</text>
-    
-    <circle cx="20" cy="50" r="15" fill="#f46d43" fill-opacity="0.7" stroke="#d73027" stroke-width="1"/>
-    <text x="45" y="55" font-family="Arial" font-size="12" fill="#2c3e50">0.50-0.55 (High)</text>
-    
-    <circle cx="20" cy="80" r="15" fill="#fdae61" fill-opacity="0.7" stroke="#f46d43" stroke-width="1"/>
-    <text x="45" y="85" font-family="Arial" font-size="12" fill="#2c3e50">0.45-0.50 (Medium)</text>
-    
-    <circle cx="20" cy="110" r="15" fill="#fee090" fill-opacity="0.7" stroke="#fdae61" stroke-width="1"/>
-    <text x="45" y="115" font-family="Arial" font-size="12" fill="#2c3e50">0.40-0.45 (Low-Med)</text>
-    
-    <circle cx="20" cy="140" r="15" fill="#74add1" fill-opacity="0.7" stroke="#4575b4" stroke-width="1"/>
-    <text x="45" y="145" font-family="Arial" font-size="12" fill="#2c3e50">&lt; 0.40 (Lower)</text>
-  </g>
+'''
+    yield _VULN_LEGEND
+    yield '''  </g>
   
   <!-- Key Insights Box -->
   <g transform="translate(100, 600)">
     <rect x="0" y="0" width="1000" height="120" fill="#fff7ec" stroke="#d73027" stroke-width="2" rx="5"/>
-    <text x="500" y="25" font-family="Arial" font-size="16" font-weight="bold" text-anchor="middle" fill="#d73027">
+    <text x="500" y="25" font-size="16" font-weight="bold" text-anchor="middle" fill="#d73027">
       Critical Vulnerability Patterns
     </text>
-    <text x="50" y="50" font-family="Arial" font-size="13" fill="#2c3e50">
+    <text x="50" y="50" font-size="13" fill="#2c3e50">
       • Coastal nations (Mozambique, Madagascar) face highest vulnerability due to cyclone exposure
     </text>
-    <text x="50" y="72" font-family="Arial" font-size="13" fill="#2c3e50">
+    <text x="50" y="72" font-size="13" fill="#2c3e50">
       • Landlocked countries show mixed patterns: Lesotho/Malawi vulnerable despite less direct exposure
     </text>
-    <text x="50" y="94" font-family="Arial" font-size="13" fill="#2c3e50">
+    <text x="50" y="94" font-size="13" fill="#2c3e50">
       • Economic development strongly correlates with adaptive capacity (South Africa, Botswana leading)
     </text>
   </g>
   
   <!-- Data source -->
-  <text x="600" y="760" font-family="Arial" font-size="10" text-anchor="middle" fill="#999999">
+  <text x="600" y="760" font-size="10" text-anchor="middle" fill="#999999">
     Data: ND-GAIN Country Index 2023, Notre Dame Global Adaptation Initiative
   </text>
-</svg>'''
+'''
     
-    with open("southern_africa_vulnerability_index.svg", "w") as f:
-        f.write(svg_content)
-    print("Created: southern_africa_vulnerability_index.svg")
+    yield "</svg>"
 
+@_cached_svg("southern_africa_integrated_climate_risk.svg")
 def create_integrated_climate_risk_diagram():
     """Create integrated climate risk visualization combining all factors"""
     
-    svg_content = '''<svg width="1400" height="900" xmlns="http://www.w3.org/2000/svg">
-  <!-- Background -->
-  <rect width="1400" height="900" fill="#f8f9fa"/>
-  
-  <!-- Title -->
-  <text x="700" y="35" font-family="Arial, sans-serif" font-size="26" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-    Southern Africa Integrated Climate Risk Assessment
-  </text>
-  <text x="700" y="60" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
-    Combining temperature rise, precipitation decline, and socioeconomic vulnerability
-  </text>
-  
-  <!-- Main Risk Matrix -->
+    yield _DIAGRAM_HEADER.substitute(width=1400, height=900, center=700, title_size=26,
+                                     title="Southern Africa Integrated Climate Risk Assessment",
+                                     subtitle="Combining temperature rise, precipitation decline, and socioeconomic vulnerability")
+    yield '''  <!-- Main Risk Matrix -->
   <g transform="translate(100, 100)">
     <!-- Matrix background -->
     <rect x="0" y="0" width="800" height="500" fill="white" stroke="#333333" stroke-width="2"/>
     
     <!-- Grid -->
-    <line x1="0" y1="125" x2="800" y2="125" stroke="#cccccc" stroke-width="1"/>
-    <line x1="0" y1="250" x2="800" y2="250" stroke="#cccccc" stroke-width="1"/>
-    <line x1="0" y1="375" x2="800" y2="375" stroke="#cccccc" stroke-width="1"/>
-    
-    <line x1="200" y1="0" x2="200" y2="500" stroke="#cccccc" stroke-width="1"/>
-    <line x1="400" y1="0" x2="400" y2="500" stroke="#cccccc" stroke-width="1"/>
-    <line x1="600" y1="0" x2="600" y2="500" stroke="#cccccc" stroke-width="1"/>
-    
-    <!-- Risk zones coloring -->
-    <rect x="0" y="0" width="200" height="125" fill="#fee090" fill-opacity="0.3"/>
-    <rect x="200" y="0" width="200" height="125" fill="#fdae61" fill-opacity="0.3"/>
-    <rect x="400" y="0" width="200" height="125" fill="#f46d43" fill-opacity="0.3"/>
-    <rect x="600" y="0" width="200" height="125" fill="#d73027" fill-opacity="0.3"/>
-    
-    <rect x="0" y="125" width="200" height="125" fill="#e0f3f8" fill-opacity="0.3"/>
-    <rect x="200" y="125" width="200" height="125" fill="#fee090" fill-opacity="0.3"/>
-    <rect x="400" y="125" width="200" height="125" fill="#fdae61" fill-opacity="0.3"/>
-    <rect x="600" y="125" width="200" height="125" fill="#f46d43" fill-opacity="0.3"/>
-    
-    <rect x="0" y="250" width="200" height="125" fill="#abd9e9" fill-opacity="0.3"/>
-    <rect x="200" y="250" width="200" height="125" fill="#e0f3f8" fill-opacity="0.3"/>
-    <rect x="400" y="250" width="200" height="125" fill="#fee090" fill-opacity="0.3"/>
-    <rect x="600" y="250" width="200" height="125" fill="#fdae61" fill-opacity="0.3"/>
-    
-    <rect x="0" y="375" width="200" height="125" fill="#74add1" fill-opacity="0.3"/>
-    <rect x="200" y="375" width="200" height="125" fill="#abd9e9" fill-opacity="0.3"/>
-    <rect x="400" y="375" width="200" height="125" fill="#e0f3f8" fill-opacity="0.3"/>
-    <rect x="600" y="375" width="200" height="125" fill="#fee090" fill-opacity="0.3"/>
-    
+'''
+    yield _RISK_GRID
+    yield '''    
+    <!-- Risk zones coloring, one path per zone colour -->
+'''
+    yield _RISK_ZONES
+    yield '''    
     <!-- Country positions based on combined risk -->
-    <!-- Mozambique - Extreme Risk -->
-    <g transform="translate(680, 60)">
-      <circle r="30" fill="#8b0000" fill-opacity="0.8" stroke="#4d0000" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MOZ</text>
-    </g>
-    
-    <!-- Madagascar - Very High Risk -->
-    <g transform="translate(520, 80)">
-      <circle r="28" fill="#d73027" fill-opacity="0.8" stroke="#8b0000" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MDG</text>
-    </g>
-    
-    <!-- Zimbabwe - High Risk -->
-    <g transform="translate(480, 180)">
-      <circle r="26" fill="#f46d43" fill-opacity="0.8" stroke="#d73027" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">ZWE</text>
-    </g>
-    
-    <!-- Malawi - High Risk -->
-    <g transform="translate(520, 210)">
-      <circle r="26" fill="#f46d43" fill-opacity="0.8" stroke="#d73027" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="white">MWI</text>
-    </g>
-    
-    <!-- Zambia - Moderate-High Risk -->
-    <g transform="translate(380, 180)">
-      <circle r="25" fill="#fdae61" fill-opacity="0.8" stroke="#f46d43" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">ZMB</text>
-    </g>
-    
-    <!-- Angola - Moderate-High Risk -->
-    <g transform="translate(320, 150)">
-      <circle r="25" fill="#fdae61" fill-opacity="0.8" stroke="#f46d43" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">AGO</text>
-    </g>
-    
-    <!-- Lesotho - Moderate Risk -->
-    <g transform="translate(420, 280)">
-      <circle r="24" fill="#fee090" fill-opacity="0.8" stroke="#fdae61" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">LSO</text>
-    </g>
-    
-    <!-- Eswatini - Moderate Risk -->
-    <g transform="translate(380, 310)">
-      <circle r="23" fill="#fee090" fill-opacity="0.8" stroke="#fdae61" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">SWZ</text>
-    </g>
-    
-    <!-- Namibia - Moderate Risk (high climate stress, lower vulnerability) -->
-    <g transform="translate(480, 340)">
-      <circle r="24" fill="#fee090" fill-opacity="0.8" stroke="#fdae61" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">NAM</text>
-    </g>
-    
-    <!-- Botswana - Lower-Moderate Risk -->
-    <g transform="translate(280, 360)">
-      <circle r="23" fill="#e0f3f8" fill-opacity="0.8" stroke="#abd9e9" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">BWA</text>
-    </g>
-    
-    <!-- South Africa - Lower Risk (relative) -->
-    <g transform="translate(220, 400)">
-      <circle r="22" fill="#abd9e9" fill-opacity="0.8" stroke="#74add1" stroke-width="2"/>
-      <text y="5" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">ZAF</text>
-    </g>
-    
-    <!-- Axis labels -->
-    <text x="400" y="540" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+'''
+    
+    # Highest risk class first, matching the previous per-country drawing order
+    for cls in np.unique(RISK_CLASSES)[::-1]:
+        members = RISK_CLASSES == cls
+        d = "".join(RISK_CIRCLE_ARCS_TMPL % (x - r, y, r, r, 2 * r, r, r, -2 * r)
+                    for (x, y), r in zip(RISK_POS[members].tolist(), RISK_R[members].tolist()))
+        yield RISK_CIRCLES_TMPL % (d, RISK_FILLS[cls], RISK_STROKES[cls])
+    
+    label_fmt = RISK_LABEL_TMPL.__mod__
+    records = zip(RISK_LABELS, RISK_POS.tolist(), RISK_TEXT_COLORS[RISK_CLASSES].tolist(), RISK_CODES)
+    for label, (x, y), text_fill, code in records:
+        yield label_fmt((label, x, y + 5, text_fill, code))
+    yield "    \n"
+    
+    yield '''    <!-- Axis labels -->
+    <text x="400" y="540" class="s14 b m c">
       Climate Stress (Temperature + Precipitation Change) →
     </text>
-    <text x="-250" y="-40" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50" transform="rotate(-90)">
+    <text x="-250" y="-40" class="s14 b m c" transform="rotate(-90)">
       Socioeconomic Vulnerability →
     </text>
     
     <!-- Risk level labels -->
-    <text x="100" y="-15" font-family="Arial" font-size="12" text-anchor="middle" fill="#74add1">Low Climate Stress</text>
-    <text x="300" y="-15" font-family="Arial" font-size="12" text-anchor="middle" fill="#fee090">Moderate Stress</text>
-    <text x="500" y="-15" font-family="Arial" font-size="12" text-anchor="middle" fill="#f46d43">High Stress</text>
-    <text x="700" y="-15" font-family="Arial" font-size="12" text-anchor="middle" fill="#d73027">Extreme Stress</text>
-    
-    <text x="-20" y="62" font-family="Arial" font-size="12" text-anchor="end" fill="#d73027">Very High Vuln.</text>
-    <text x="-20" y="187" font-family="Arial" font-size="12" text-anchor="end" fill="#f46d43">High Vuln.</text>
-    <text x="-20" y="312" font-family="Arial" font-size="12" text-anchor="end" fill="#fee090">Moderate Vuln.</text>
-    <text x="-20" y="437" font-family="Arial" font-size="12" text-anchor="end" fill="#74add1">Lower Vuln.</text>
+    <text x="100" y="-15" class="s12 m" fill="#74add1">Low Climate Stress</text>
+    <text x="300" y="-15" class="s12 m" fill="#fee090">Moderate Stress</text>
+    <text x="500" y="-15" class="s12 m" fill="#f46d43">High Stress</text>
+    <text x="700" y="-15" class="s12 m" fill="#d73027">Extreme Stress</text>
+    
+    <text x="-20" y="62" class="s12 e" fill="#d73027">Very High Vuln.</text>
+    <text x="-20" y="187" class="s12 e" fill="#f46d43">High Vuln.</text>
+    <text x="-20" y="312" class="s12 e" fill="#fee090">Moderate Vuln.</text>
+    <text x="-20" y="437" class="s12 e" fill="#74add1">Lower Vuln.</text>
   </g>
   
-  <!-- Risk Factors Panel -->
+'''
+    
+    yield '''  <!-- Risk Factors Panel -->
   <g transform="translate(950, 120)">
     <rect x="0" y="0" width="350" height="480" fill="white" stroke="#cccccc" stroke-width="1" rx="5"/>
     
-    <text x="175" y="30" font-family="Arial" font-size="18" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    <text x="175" y="30" class="s18 b m c">
       Compound Risk Factors
     </text>
     
     <!-- Temperature -->
     <g transform="translate(20, 60)">
       <rect x="0" y="0" width="310" height="100" fill="#fff7ec" stroke="#d73027" stroke-width="1" rx="3"/>
-      <text x="10" y="20" font-family="Arial" font-size="14" font-weight="bold" fill="#d73027">Temperature Rise</text>
-      <text x="10" y="40" font-family="Arial" font-size="12" fill="#2c3e50">• Current: +0.9 to +1.6°C</text>
-      <text x="10" y="58" font-family="Arial" font-size="12" fill="#2c3e50">• 2050: Additional +1.2-1.8°C</text>
-      <text x="10" y="76" font-family="Arial" font-size="12" fill="#2c3e50">• Hotspots: Interior regions</text>
-      <text x="10" y="94" font-family="Arial" font-size="11" fill="#5a6c7d">→ Heat stress, crop failure risk</text>
+      <text x="10" y="20" class="s14 b" fill="#d73027">Temperature Rise</text>
+      <text x="10" y="40" class="s12 c">• Current: +0.9 to +1.6°C</text>
+      <text x="10" y="58" class="s12 c">• 2050: Additional +1.2-1.8°C</text>
+      <text x="10" y="76" class="s12 c">• Hotspots: Interior regions</text>
+      <text x="10" y="94" class="s11" fill="#5a6c7d">→ Heat stress, crop failure risk</text>
     </g>
     
     <!-- Precipitation -->
     <g transform="translate(20, 175)">
       <rect x="0" y="0" width="310" height="100" fill="#fef0d9" stroke="#8c510a" stroke-width="1" rx="3"/>
-      <text x="10" y="20" font-family="Arial" font-size="14" font-weight="bold" fill="#8c510a">Precipitation Decline</text>
-      <text x="10" y="40" font-family="Arial" font-size="12" fill="#2c3e50">• Annual: -3% to -15%</text>
-      <text x="10" y="58" font-family="Arial" font-size="12" fill="#2c3e50">• Wet season: -5% to -18%</text>
-      <text x="10" y="76" font-family="Arial" font-size="12" fill="#2c3e50">• Southwest most affected</text>
-      <text x="10" y="94" font-family="Arial" font-size="11" fill="#5a6c7d">→ Water stress, drought risk</text>
+      <text x="10" y="20" class="s14 b" fill="#8c510a">Precipitation Decline</text>
+      <text x="10" y="40" class="s12 c">• Annual: -3% to -15%</text>
+      <text x="10" y="58" class="s12 c">• Wet season: -5% to -18%</text>
+      <text x="10" y="76" class="s12 c">• Southwest most affected</text>
+      <text x="10" y="94" class="s11" fill="#5a6c7d">→ Water stress, drought risk</text>
     </g>
     
     <!-- Vulnerability -->
     <g transform="translate(20, 290)">
       <rect x="0" y="0" width="310" height="100" fill="#f0f9ff" stroke="#4575b4" stroke-width="1" rx="3"/>
-      <text x="10" y="20" font-family="Arial" font-size="14" font-weight="bold" fill="#4575b4">Vulnerability Drivers</text>
-      <text x="10" y="40" font-family="Arial" font-size="12" fill="#2c3e50">• Food security challenges</text>
-      <text x="10" y="58" font-family="Arial" font-size="12" fill="#2c3e50">• Water resource stress</text>
-      <text x="10" y="76" font-family="Arial" font-size="12" fill="#2c3e50">• Limited adaptive capacity</text>
-      <text x="10" y="94" font-family="Arial" font-size="11" fill="#5a6c7d">→ Amplifies climate impacts</text>
+      <text x="10" y="20" class="s14 b" fill="#4575b4">Vulnerability Drivers</text>
+      <text x="10" y="40" class="s12 c">• Food security challenges</text>
+      <text x="10" y="58" class="s12 c">• Water resource stress</text>
+      <text x="10" y="76" class="s12 c">• Limited adaptive capacity</text>
+      <text x="10" y="94" class="s11" fill="#5a6c7d">→ Amplifies climate impacts</text>
     </g>
     
     <!-- Priority Actions -->
-    <text x="175" y="420" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    <text x="175" y="420" class="s14 b m c">
       Priority Adaptation Needs
     </text>
-    <text x="20" y="445" font-family="Arial" font-size="12" fill="#d73027">• Extreme Risk: MOZ, MDG</text>
-    <text x="30" y="462" font-family="Arial" font-size="11" fill="#5a6c7d">Coastal protection, early warning</text>
-    <text x="20" y="482" font-family="Arial" font-size="12" fill="#f46d43">• High Risk: ZWE, MWI, ZMB</text>
-    <text x="30" y="499" font-family="Arial" font-size="11" fill="#5a6c7d">Agriculture adaptation, water mgmt</text>
-    <text x="20" y="519" font-family="Arial" font-size="12" fill="#fdae61">• Moderate: NAM, LSO, SWZ</text>
-    <text x="30" y="536" font-family="Arial" font-size="11" fill="#5a6c7d">Drought resilience, infrastructure</text>
+    <text x="20" y="445" class="s12" fill="#d73027">• Extreme Risk: MOZ, MDG</text>
+    <text x="30" y="462" class="s11" fill="#5a6c7d">Coastal protection, early warning</text>
+    <text x="20" y="482" class="s12" fill="#f46d43">• High Risk: ZWE, MWI, ZMB</text>
+    <text x="30" y="499" class="s11" fill="#5a6c7d">Agriculture adaptation, water mgmt</text>
+    <text x="20" y="519" class="s12" fill="#fdae61">• Moderate: NAM, LSO, SWZ</text>
+    <text x="30" y="536" class="s11" fill="#5a6c7d">Drought resilience, infrastructure</text>
   </g>
   
-  <!-- Temporal Projection -->
+'''
+    
+    yield '''  <!-- Temporal Projection -->
   <g transform="translate(100, 650)">
     <rect x="0" y="0" width="1200" height="180" fill="white" stroke="#333333" stroke-width="2" rx="5"/>
     
-    <text x="600" y="30" font-family="Arial" font-size="16" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    <text x="600" y="30" class="s16 b m c">
       Risk Evolution Timeline
     </text>
     
@@ -935,249 +972,186 @@ def create_integrated_climate_risk_diagram():
     <line x1="100" y1="100" x2="1100" y2="100" stroke="#333333" stroke-width="2"/>
     
     <!-- Time markers -->
-    <line x1="100" y1="95" x2="100" y2="105" stroke="#333333" stroke-width="2"/>
-    <text x="100" y="125" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2020</text>
-    
-    <line x1="350" y1="95" x2="350" y2="105" stroke="#333333" stroke-width="2"/>
-    <text x="350" y="125" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2030</text>
-    
-    <line x1="600" y1="95" x2="600" y2="105" stroke="#333333" stroke-width="2"/>
-    <text x="600" y="125" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2040</text>
-    
-    <line x1="850" y1="95" x2="850" y2="105" stroke="#333333" stroke-width="2"/>
-    <text x="850" y="125" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2050</text>
-    
-    <line x1="1100" y1="95" x2="1100" y2="105" stroke="#333333" stroke-width="2"/>
-    <text x="1100" y="125" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2060</text>
-    
+'''
+    yield _TIMELINE_TICKS
+    yield _TIMELINE_LABELS
+    yield '''    
     <!-- Risk progression curves -->
-    <path d="M 100 90 Q 350 85, 600 75 T 1100 50" 
-          fill="none" stroke="#d73027" stroke-width="3" opacity="0.7"/>
-    <text x="1120" y="55" font-family="Arial" font-size="11" fill="#d73027">Temperature</text>
-    
-    <path d="M 100 95 Q 350 92, 600 88 T 1100 75" 
-          fill="none" stroke="#8c510a" stroke-width="3" opacity="0.7"/>
-    <text x="1120" y="80" font-family="Arial" font-size="11" fill="#8c510a">Drought</text>
-    
-    <path d="M 100 85 Q 350 80, 600 70 T 1100 45" 
-          fill="none" stroke="#4575b4" stroke-width="3" opacity="0.7"/>
-    <text x="1120" y="50" font-family="Arial" font-size="11" fill="#4575b4">Overall Risk</text>
-    
-    <!-- Key thresholds -->
+'''
+    yield _TIMELINE_TRENDS
+    yield '''    <!-- Key thresholds -->
     <line x1="400" y1="40" x2="400" y2="100" stroke="#ff0000" stroke-width="1" stroke-dasharray="3,3" opacity="0.5"/>
-    <text x="400" y="35" font-family="Arial" font-size="10" text-anchor="middle" fill="#ff0000">+1.5°C</text>
+    <text x="400" y="35" class="s10 m" fill="#ff0000">+1.5°C</text>
     
     <line x1="750" y1="40" x2="750" y2="100" stroke="#ff0000" stroke-width="1" stroke-dasharray="3,3" opacity="0.5"/>
-    <text x="750" y="35" font-family="Arial" font-size="10" text-anchor="middle" fill="#ff0000">+2.0°C</text>
+    <text x="750" y="35" class="s10 m" fill="#ff0000">+2.0°C</text>
   </g>
   
-  <!-- Data attribution -->
-  <text x="700" y="870" font-family="Arial" font-size="10" text-anchor="middle" fill="#999999">
+'''
+    
+    yield '''  <!-- Data attribution -->
+  <text x="700" y="870" class="s10 m" fill="#999999">
     Data Sources: IPCC AR6, World Bank Climate Portal, ND-GAIN Index 2023, SADC Climate Assessment
   </text>
 </svg>'''
-    
-    with open("southern_africa_integrated_climate_risk.svg", "w") as f:
-        f.write(svg_content)
-    print("Created: southern_africa_integrated_climate_risk.svg")
 
+@_cached_svg("southern_africa_temporal_climate_change.svg")
 def create_temporal_change_visualization():
     """Create temporal visualization showing changes over time"""
     
-    svg_content = '''<svg width="1200" height="800" xmlns="http://www.w3.org/2000/svg">
-  <!-- Background -->
-  <rect width="1200" height="800" fill="#f8f9fa"/>
-  
-  <!-- Title -->
-  <text x="600" y="35" font-family="Arial, sans-serif" font-size="24" font-weight="bold" text-anchor="middle" fill="#2c3e50">
-    Southern Africa Climate Change Trajectory 1960-2100
-  </text>
-  <text x="600" y="60" font-family="Arial, sans-serif" font-size="16" text-anchor="middle" fill="#5a6c7d">
-    Historical observations and future projections under different scenarios
-  </text>
-  
-  <!-- Main chart area -->
+    yield _DIAGRAM_HEADER.substitute(width=1200, height=800, center=600, title_size=24,
+                                     title="Southern Africa Climate Change Trajectory 1960-2100",
+                                     subtitle="Historical observations and future projections under different scenarios")
+    yield '''  <!-- Main chart area -->
   <g transform="translate(100, 100)">
     <!-- Chart background -->
     <rect x="0" y="0" width="900" height="400" fill="white" stroke="#333333" stroke-width="2"/>
     
     <!-- Grid lines -->
-    <line x1="0" y1="100" x2="900" y2="100" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="0" y1="200" x2="900" y2="200" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="0" y1="300" x2="900" y2="300" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    
-    <line x1="150" y1="0" x2="150" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="300" y1="0" x2="300" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="450" y1="0" x2="450" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="600" y1="0" x2="600" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
-    <line x1="750" y1="0" x2="750" y2="400" stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
+    <path d="M0 100H900M0 200H900M0 300H900M150 0V400M300 0V400M450 0V400M600 0V400M750 0V400"
+          stroke="#e0e0e0" stroke-width="1" stroke-dasharray="2,2"/>
     
     <!-- Historical period background -->
     <rect x="0" y="0" width="450" height="400" fill="#f0f0f0" fill-opacity="0.3"/>
-    <text x="225" y="20" font-family="Arial" font-size="12" font-weight="bold" text-anchor="middle" fill="#666666">
+    <text x="225" y="20" class="s12 b m" fill="#666666">
       OBSERVED
     </text>
     
     <!-- Future period background -->
     <rect x="450" y="0" width="450" height="400" fill="#fff7ec" fill-opacity="0.3"/>
-    <text x="675" y="20" font-family="Arial" font-size="12" font-weight="bold" text-anchor="middle" fill="#d73027">
+    <text x="675" y="20" class="s12 b m" fill="#d73027">
       PROJECTED
     </text>
     
-    <!-- Temperature trends -->
-    <!-- Historical observed -->
-    <path d="M 0 350 L 150 340 L 300 320 L 450 280" 
-          fill="none" stroke="#333333" stroke-width="3"/>
+'''
     
-    <!-- SSP1-2.6 (Low emissions) -->
-    <path d="M 450 280 Q 600 250, 750 240 T 900 235" 
-          fill="none" stroke="#4575b4" stroke-width="2" stroke-dasharray="5,3"/>
-    
-    <!-- SSP2-4.5 (Medium emissions) -->
-    <path d="M 450 280 Q 600 220, 750 180 T 900 150" 
-          fill="none" stroke="#fdae61" stroke-width="2"/>
-    
-    <!-- SSP5-8.5 (High emissions) -->
-    <path d="M 450 280 Q 600 180, 750 100 T 900 50" 
-          fill="none" stroke="#d73027" stroke-width="2" stroke-dasharray="8,4"/>
-    
-    <!-- Precipitation trends (inverted scale) -->
-    <!-- Historical observed -->
-    <path d="M 0 200 L 150 210 L 300 225 L 450 245" 
-          fill="none" stroke="#8c510a" stroke-width="3" opacity="0.7"/>
-    
-    <!-- Future projections -->
-    <path d="M 450 245 Q 600 265, 750 285 T 900 310" 
-          fill="none" stroke="#8c510a" stroke-width="2" opacity="0.5" stroke-dasharray="5,3"/>
-    
-    <!-- Time axis labels -->
-    <text x="0" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">1960</text>
-    <text x="150" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">1980</text>
-    <text x="300" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2000</text>
-    <text x="450" y="430" font-family="Arial" font-size="12" font-weight="bold" text-anchor="middle" fill="#2c3e50">2020</text>
-    <text x="600" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2040</text>
-    <text x="750" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2060</text>
-    <text x="900" y="430" font-family="Arial" font-size="12" text-anchor="middle" fill="#2c3e50">2080</text>
+    yield _TEMPORAL_TRENDS
     
+    yield '''    <!-- Time axis labels -->
+'''
+    yield _TEMPORAL_YEAR_LABELS
+    yield '''    
     <!-- Y-axis labels (Temperature) -->
-    <text x="-20" y="405" font-family="Arial" font-size="12" text-anchor="end" fill="#2c3e50">0°C</text>
-    <text x="-20" y="305" font-family="Arial" font-size="12" text-anchor="end" fill="#2c3e50">+1°C</text>
-    <text x="-20" y="205" font-family="Arial" font-size="12" text-anchor="end" fill="#2c3e50">+2°C</text>
-    <text x="-20" y="105" font-family="Arial" font-size="12" text-anchor="end" fill="#2c3e50">+3°C</text>
-    <text x="-20" y="5" font-family="Arial" font-size="12" text-anchor="end" fill="#2c3e50">+4°C</text>
-    
+'''
+    yield _TEMPORAL_TEMP_LABELS
+    yield '''    
     <!-- Y-axis label -->
-    <text x="-50" y="200" font-family="Arial" font-size="13" font-weight="bold" text-anchor="middle" fill="#d73027" transform="rotate(-90, -50, 200)">
+    <text x="-50" y="200" class="s13 b m" fill="#d73027" transform="rotate(-90, -50, 200)">
       Temperature Anomaly
     </text>
     
     <!-- Secondary Y-axis labels (Precipitation) -->
-    <text x="920" y="205" font-family="Arial" font-size="12" text-anchor="start" fill="#8c510a">0%</text>
-    <text x="920" y="255" font-family="Arial" font-size="12" text-anchor="start" fill="#8c510a">-5%</text>
-    <text x="920" y="305" font-family="Arial" font-size="12" text-anchor="start" fill="#8c510a">-10%</text>
-    <text x="920" y="355" font-family="Arial" font-size="12" text-anchor="start" fill="#8c510a">-15%</text>
-    
+'''
+    yield _TEMPORAL_PRECIP_LABELS
+    yield '''    
     <!-- Secondary Y-axis label -->
-    <text x="960" y="280" font-family="Arial" font-size="13" font-weight="bold" text-anchor="middle" fill="#8c510a" transform="rotate(90, 960, 280)">
+    <text x="960" y="280" class="s13 b m" fill="#8c510a" transform="rotate(90, 960, 280)">
       Precipitation Change
     </text>
     
     <!-- Key events and thresholds -->
     <line x1="450" y1="0" x2="450" y2="400" stroke="#ff0000" stroke-width="2"/>
-    <text x="450" y="-10" font-family="Arial" font-size="11" font-weight="bold" text-anchor="middle" fill="#ff0000">Present</text>
+    <text x="450" y="-10" class="s11 b m" fill="#ff0000">Present</text>
     
     <!-- Paris Agreement targets -->
     <line x1="0" y1="280" x2="900" y2="280" stroke="#22aa22" stroke-width="1" stroke-dasharray="5,5" opacity="0.5"/>
-    <text x="910" y="283" font-family="Arial" font-size="10" fill="#22aa22">+1.5°C target</text>
+    <text x="910" y="283" class="s10" fill="#22aa22">+1.5°C target</text>
     
     <line x1="0" y1="200" x2="900" y2="200" stroke="#ff8800" stroke-width="1" stroke-dasharray="5,5" opacity="0.5"/>
-    <text x="910" y="203" font-family="Arial" font-size="10" fill="#ff8800">+2.0°C target</text>
+    <text x="910" y="203" class="s10" fill="#ff8800">+2.0°C target</text>
   </g>
   
-  <!-- Scenario Legend -->
+'''
+    
+    yield '''  <!-- Scenario Legend -->
   <g transform="translate(1050, 150)">
     <rect x="-10" y="-10" width="140" height="150" fill="white" stroke="#cccccc" stroke-width="1" rx="5"/>
     
-    <text x="60" y="10" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#2c3e50">
+    <text x="60" y="10" class="s14 b m c">
       Scenarios
     </text>
     
     <line x1="10" y1="30" x2="40" y2="30" stroke="#333333" stroke-width="3"/>
-    <text x="45" y="35" font-family="Arial" font-size="12" fill="#2c3e50">Historical</text>
+    <text x="45" y="35" class="s12 c">Historical</text>
     
     <line x1="10" y1="55" x2="40" y2="55" stroke="#4575b4" stroke-width="2" stroke-dasharray="5,3"/>
-    <text x="45" y="60" font-family="Arial" font-size="12" fill="#4575b4">SSP1-2.6</text>
-    <text x="45" y="75" font-family="Arial" font-size="10" fill="#666">(Sustainable)</text>
+    <text x="45" y="60" class="s12" fill="#4575b4">SSP1-2.6</text>
+    <text x="45" y="75" class="s10" fill="#666">(Sustainable)</text>
     
     <line x1="10" y1="90" x2="40" y2="90" stroke="#fdae61" stroke-width="2"/>
-    <text x="45" y="95" font-family="Arial" font-size="12" fill="#fdae61">SSP2-4.5</text>
-    <text x="45" y="110" font-family="Arial" font-size="10" fill="#666">(Middle Road)</text>
+    <text x="45" y="95" class="s12" fill="#fdae61">SSP2-4.5</text>
+    <text x="45" y="110" class="s10" fill="#666">(Middle Road)</text>
     
     <line x1="10" y1="125" x2="40" y2="125" stroke="#d73027" stroke-width="2" stroke-dasharray="8,4"/>
-    <text x="45" y="130" font-family="Arial" font-size="12" fill="#d73027">SSP5-8.5</text>
-    <text x="45" y="145" font-family="Arial" font-size="10" fill="#666">(Fossil-fueled)</text>
+    <text x="45" y="130" class="s12" fill="#d73027">SSP5-8.5</text>
+    <text x="45" y="145" class="s10" fill="#666">(Fossil-fueled)</text>
   </g>
   
-  <!-- Impact Boxes -->
+'''
+    
+    yield '''  <!-- Impact Boxes -->
   <g transform="translate(100, 550)">
     <!-- Temperature Impacts -->
     <rect x="0" y="0" width="280" height="150" fill="#fff7ec" stroke="#d73027" stroke-width="2" rx="5"/>
-    <text x="140" y="25" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#d73027">
+    <text x="140" y="25" class="s14 b m" fill="#d73027">
       Temperature Impacts by 2050
     </text>
-    <text x="15" y="50" font-family="Arial" font-size="12" fill="#2c3e50">• Heat waves: +20-30 days/year</text>
-    <text x="15" y="70" font-family="Arial" font-size="12" fill="#2c3e50">• Growing season: -10 to -20 days</text>
-    <text x="15" y="90" font-family="Arial" font-size="12" fill="#2c3e50">• Evapotranspiration: +15-25%</text>
-    <text x="15" y="110" font-family="Arial" font-size="12" fill="#2c3e50">• Heat stress days: Double</text>
-    <text x="15" y="130" font-family="Arial" font-size="11" font-style="italic" fill="#666">Regional average under SSP2-4.5</text>
+    <text x="15" y="50" class="s12 c">• Heat waves: +20-30 days/year</text>
+    <text x="15" y="70" class="s12 c">• Growing season: -10 to -20 days</text>
+    <text x="15" y="90" class="s12 c">• Evapotranspiration: +15-25%</text>
+    <text x="15" y="110" class="s12 c">• Heat stress days: Double</text>
+    <text x="15" y="130" class="s11 i" fill="#666">Regional average under SSP2-4.5</text>
   </g>
   
   <g transform="translate(420, 550)">
     <!-- Precipitation Impacts -->
     <rect x="0" y="0" width="280" height="150" fill="#fef0d9" stroke="#8c510a" stroke-width="2" rx="5"/>
-    <text x="140" y="25" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#8c510a">
+    <text x="140" y="25" class="s14 b m" fill="#8c510a">
       Precipitation Impacts by 2050
     </text>
-    <text x="15" y="50" font-family="Arial" font-size="12" fill="#2c3e50">• Drought frequency: +40%</text>
-    <text x="15" y="70" font-family="Arial" font-size="12" fill="#2c3e50">• Flood intensity: +25%</text>
-    <text x="15" y="90" font-family="Arial" font-size="12" fill="#2c3e50">• Dry spells: +15-20 days</text>
-    <text x="15" y="110" font-family="Arial" font-size="12" fill="#2c3e50">• Seasonal shift: 2-4 weeks</text>
-    <text x="15" y="130" font-family="Arial" font-size="11" font-style="italic" fill="#666">Higher variability expected</text>
+    <text x="15" y="50" class="s12 c">• Drought frequency: +40%</text>
+    <text x="15" y="70" class="s12 c">• Flood intensity: +25%</text>
+    <text x="15" y="90" class="s12 c">• Dry spells: +15-20 days</text>
+    <text x="15" y="110" class="s12 c">• Seasonal shift: 2-4 weeks</text>
+    <text x="15" y="130" class="s11 i" fill="#666">Higher variability expected</text>
   </g>
   
   <g transform="translate(740, 550)">
     <!-- Compound Impacts -->
     <rect x="0" y="0" width="280" height="150" fill="#f0f9ff" stroke="#4575b4" stroke-width="2" rx="5"/>
-    <text x="140" y="25" font-family="Arial" font-size="14" font-weight="bold" text-anchor="middle" fill="#4575b4">
+    <text x="140" y="25" class="s14 b m" fill="#4575b4">
       Compound Risks by 2050
     </text>
-    <text x="15" y="50" font-family="Arial" font-size="12" fill="#2c3e50">• Crop yields: -20% to -30%</text>
-    <text x="15" y="70" font-family="Arial" font-size="12" fill="#2c3e50">• Water availability: -25%</text>
-    <text x="15" y="90" font-family="Arial" font-size="12" fill="#2c3e50">• Migration risk: High</text>
-    <text x="15" y="110" font-family="Arial" font-size="12" fill="#2c3e50">• GDP impact: -5% to -8%</text>
-    <text x="15" y="130" font-family="Arial" font-size="11" font-style="italic" fill="#666">Without adaptation measures</text>
+    <text x="15" y="50" class="s12 c">• Crop yields: -20% to -30%</text>
+    <text x="15" y="70" class="s12 c">• Water availability: -25%</text>
+    <text x="15" y="90" class="s12 c">• Migration risk: High</text>
+    <text x="15" y="110" class="s12 c">• GDP impact: -5% to -8%</text>
+    <text x="15" y="130" class="s11 i" fill="#666">Without adaptation measures</text>
   </g>
   
-  <!-- Attribution -->
-  <text x="600" y="760" font-family="Arial" font-size="10" text-anchor="middle" fill="#999">
+'''
+    
+    yield '''  <!-- Attribution -->
+  <text x="600" y="760" class="s10 m" fill="#999">
     Data: IPCC AR6 WGI/II, CMIP6 Multi-model Ensemble, SADC Regional Climate Projections
   </text>
 </svg>'''
-    
-    with open("southern_africa_temporal_climate_change.svg", "w") as f:
-        f.write(svg_content)
-    print("Created: southern_africa_temporal_climate_change.svg")
 
 # Main execution
 if __name__ == "__main__":
     print("Creating Southern Africa Climate Data Visualizations...")
     print("=" * 50)
     
-    create_temperature_anomaly_map()
-    create_precipitation_change_map()
-    create_vulnerability_index_map()
-    create_integrated_climate_risk_diagram()
-    create_temporal_change_visualization()
+    # Each visualization writes its own file and shares no state, so generate
+    # them in parallel. The pool is imported here so importing this module for
+    # its tables stays cheap
+    from concurrent.futures import ProcessPoolExecutor
+    creators = [create_temperature_anomaly_map, create_precipitation_change_map,
+                create_vulnerability_index_map, create_integrated_climate_risk_diagram,
+                create_temporal_change_visualization]
+    with ProcessPoolExecutor() as executor:
+        for future in [executor.submit(create) for create in creators]:
+            future.result()
     
     print("=" * 50)
     print("All visualizations created successfully!")
@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 import rasterio
 import numpy as np
-import svgwrite
+from rasterio import Affine
+from rasterio.enums import Resampling
 from rasterio.windows import from_bounds
 from rasterio.features import shapes
-from shapely.geometry import shape
-from shapely.ops import unary_union
+import shapely
+import math
 import os
+import base64
+import struct
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from xml.sax.saxutils import escape, quoteattr
+from scipy import ndimage
 
 # Study sites
 study_sites = [
@@ -51,6 +61,13 @@ koppen_colors = {
     30: '#666666'   # EF - Ice cap
 }
 
+# Palette for the embedded-image map panels: index 0 (no data) is
+# transparent, followed by the Köppen class colours
+koppen_palette = np.array(
+    [[0, 0, 0]] + [[int(koppen_colors[v][i:i + 2], 16) for i in (1, 3, 5)] for v in range(1, 31)],
+    dtype=np.uint8
+)
+
 # Condensed legend - only show climate types present in Southern Africa
 condensed_legend = [
     ('A - Tropical', [
@@ -77,218 +94,331 @@ condensed_legend = [
     ])
 ]
 
+# Markup for the legend columns, filled in per group and entry
+legend_group_template = (
+    '<text x="{x}" y="{y}" font-family="Arial, sans-serif" font-size="12px" '
+    'fill="#2c3e50" font-weight="bold">{name}</text>'
+)
+legend_entry_template = (
+    '<rect x="{swatch_x}" y="{swatch_y}" width="12" height="10" fill="{color}" '
+    'stroke="#333" stroke-width="0.5" />'
+    '<text x="{text_x}" y="{y}" font-family="Arial, sans-serif" font-size="10px" '
+    'fill="black">{code} - {description}</text>'
+)
+
+svg_header_template = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+    'version="1.1" width="{width}" height="{height}">'
+)
+
+def svg_element(tag, text=None, markup=None, **attributes):
+    """Format one SVG element; underscores in attribute names become hyphens as in svgwrite
+    
+    Attribute values and text are XML-escaped as svgwrite did; markup holds
+    already formatted child elements and is written as is.
+    """
+    attrs = ''.join(f' {name.replace("_", "-")}={quoteattr(str(value))}' for name, value in attributes.items())
+    if text is not None:
+        markup = escape(text)
+    if markup is None:
+        return f'<{tag}{attrs} />'
+    return f'<{tag}{attrs}>{markup}</{tag}>'
+
 def coords_to_svg(lon, lat, west, east, north, south, svg_width, svg_height):
     """Convert geographic coordinates to SVG coordinates"""
     x = ((lon - west) / (east - west)) * svg_width
     y = ((north - lat) / (north - south)) * svg_height
     return x, y
 
-def create_svg_path(polygon, west, east, north, south, svg_width, svg_height):
-    """Convert shapely polygon to SVG path"""
-    try:
-        if polygon.is_empty or polygon.area < 0.001:
-            return None
-            
-        coords = list(polygon.exterior.coords)
-        if not coords:
-            return None
-            
-        path_data = []
-        for i, (lon, lat) in enumerate(coords):
-            x, y = coords_to_svg(lon, lat, west, east, north, south, svg_width, svg_height)
-            if i == 0:
-                path_data.append(f"M {x:.1f} {y:.1f}")
-            else:
-                path_data.append(f"L {x:.1f} {y:.1f}")
+def create_svg_path(rings, west, east, north, south, svg_width, svg_height):
+    """Convert polygon rings (shell first, then holes) to an SVG path"""
+    subpaths = []
+    for ring in rings:
+        # coords_to_svg applied to the whole ring at once
+        points = np.empty_like(ring)
+        points[:, 0] = (ring[:, 0] - west) * (svg_width / (east - west))
+        points[:, 1] = (north - ring[:, 1]) * (svg_height / (north - south))
         
-        path_data.append("Z")
-        return " ".join(path_data)
+        # Whole pixels are plenty at map scale. The closing vertex is left to
+        # Z, and vertices that round onto the one before them are dropped
+        points = np.rint(points[:-1]).astype(int)
+        points = points[np.any(np.diff(points, axis=0, prepend=points[-1:]) != 0, axis=1)]
+        if len(points) < 3:
+            continue
         
-    except Exception:
-        return None
+        path_format = "M {} {} " + "L {} {} " * (len(points) - 1) + "Z"
+        subpaths.append(path_format.format(*points.ravel().tolist()))
+    return " ".join(subpaths)
 
-def create_condensed_layout(tif_paths, output_path, show_sites=True, show_labels=True):
-    """Create layout with condensed legend"""
+def ring_area(ring):
+    """Shoelace area of a closed ring"""
+    return abs(np.dot(ring[:-1, 0], ring[1:, 1]) - np.dot(ring[1:, 0], ring[:-1, 1])) / 2
+
+def zone_polygons(data, transform, min_area=0.005, tolerance=None):
+    """Trace every climate zone in one pass, keeping polygons larger than min_area (square degrees)
     
-    # Optimized canvas size
-    total_width, total_height = 2000, 1200
-    map_width, map_height = 600, 650  # Slightly taller maps
-    top_margin = 80
-    side_margin = 50
-    map_spacing = 60
+    Returns a dict of climate value -> polygons in ascending value order, each
+    polygon being its GeoJSON rings as coordinate arrays. Polygons traced for
+    one value never overlap, so they are drawn as traced without merging.
+    The zones are simplified together as one coverage, so neighbouring zones
+    keep sharing their edges. The tolerance is roughly the square root of the
+    triangle area removed; the default of three quarters of a cell turns the
+    traced pixel staircases into straight edges. Holes that end up smaller
+    than min_area are dropped.
+    """
+    if tolerance is None:
+        tolerance = abs(transform.a) * 0.75
+    polygons_by_value = defaultdict(list)
+    # Only cells holding a Köppen class are traced, so every zone returned has a colour
+    classified = (data > 0) & (data < len(koppen_palette))
     
-    dwg = svgwrite.Drawing(output_path, size=(total_width, total_height))
+    # A traced polygon covers exactly its connected region of cells, so regions
+    # too small to be kept are found by labelling and left out of the trace
+    cell_area = abs(transform.a * transform.e)
+    if min_area >= cell_area:
+        for value in np.unique(data[classified]):
+            labels, _ = ndimage.label(data == value)
+            too_small = np.bincount(labels.ravel()) * cell_area <= min_area
+            too_small[0] = False
+            classified &= ~too_small[labels]
+    traced = [(geom['coordinates'], value)
+              for geom, value in shapes(data, mask=classified, transform=transform)]
+    if not traced:
+        return {}
     
-    # White background
-    dwg.add(dwg.rect(insert=(0, 0), size=(total_width, total_height), fill='white'))
+    rings = [ring for coordinates, _ in traced for ring in coordinates]
+    ring_index = np.repeat(np.arange(len(traced)), [len(coordinates) for coordinates, _ in traced])
+    coord_index = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+    coords = np.fromiter(chain.from_iterable(chain.from_iterable(rings)), dtype=float,
+                         count=2 * len(coord_index)).reshape(-1, 2)
+    polygons = shapely.polygons(shapely.linearrings(coords, indices=coord_index), indices=ring_index)
+    values = np.array([value for _, value in traced], dtype=data.dtype)
     
-    # Main title
-    dwg.add(dwg.text(
-        'Köppen-Geiger Climate Classification: Southern Africa',
-        insert=(total_width // 2, 35),
-        text_anchor='middle',
-        font_family='Arial, sans-serif',
-        font_size='24px',
-        fill='#2c3e50',
-        font_weight='bold'
-    ))
+    # Polygons are sized on their traced outlines, since simplifying shrinks
+    # single cells to triangles, and all of them are simplified so the kept
+    # ones still share edges
+    large = shapely.area(polygons) > min_area
+    polygons = shapely.coverage_simplify(polygons, tolerance)
     
-    # Process each time period
-    titles = ['Current Climate\n1991-2020 Baseline', 'Moderate Warming\nSSP1-2.6 2041-2070', 'Extreme Warming\nSSP5-8.5 2071-2099']
-    scenario_colors = ['#27ae60', '#f39c12', '#e74c3c']
-    
-    for i, (tif_path, title, color) in enumerate(zip(tif_paths, titles, scenario_colors)):
-        if not os.path.exists(tif_path):
-            continue
-            
-        x_offset = side_margin + i * (map_width + map_spacing)
-        y_offset = top_margin
+    for polygon, value in zip(polygons[large], values[large].tolist()):
+        holes = [shapely.get_coordinates(interior) for interior in polygon.interiors]
+        holes = [hole for hole in holes if ring_area(hole) > min_area]
+        polygons_by_value[value].append([shapely.get_coordinates(polygon.exterior)] + holes)
+    return {value: polygons_by_value[value] for value in sorted(polygons_by_value)}
+
+def legend_column_svg(groups, x, y):
+    """Format one legend column (group titles with swatch entries) as SVG markup"""
+    markup = []
+    for group_name, items in groups:
+        markup.append(legend_group_template.format(x=x + 20, y=y, name=escape(group_name)))
         
-        print(f"Processing {tif_path}...")
+        y += 18
+        for code, description, value in items:
+            if value in koppen_colors:
+                markup.append(legend_entry_template.format(
+                    swatch_x=x + 30, swatch_y=y - 8, color=koppen_colors[value],
+                    text_x=x + 48, y=y, code=escape(code), description=escape(description)
+                ))
+                y += 15
         
-        with rasterio.open(tif_path) as src:
-            window = from_bounds(10.0, -35.0, 40.0, -5.0, src.transform)
+        y += 10  # Space between groups
+    return ''.join(markup)
+
+def png_data_uri(data):
+    """Encode a Köppen class raster as an indexed-colour PNG data URI"""
+    indices = np.where(data < len(koppen_palette), data, 0).astype(np.uint8)
+    height, width = indices.shape
+    # Every scanline starts with its filter type, 0 (none)
+    scanlines = np.hstack([np.zeros((height, 1), dtype=np.uint8), indices]).tobytes()
+    
+    def chunk(tag, body):
+        return struct.pack('>I', len(body)) + tag + body + struct.pack('>I', zlib.crc32(tag + body))
+    
+    png = (b'\x89PNG\r\n\x1a\n'
+           + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))
+           + chunk(b'PLTE', koppen_palette.tobytes())
+           + chunk(b'tRNS', b'\x00')
+           + chunk(b'IDAT', zlib.compress(scanlines, 9))
+           + chunk(b'IEND', b''))
+    return 'data:image/png;base64,' + base64.b64encode(png).decode('ascii')
+
+def build_panel(tif_path, title, color, x_offset, y_offset, map_width, map_height,
+                show_sites=True, show_labels=True, zones_as_image=False):
+    """Build one time period's map panel as SVG markup
+    
+    Runs in a worker process, so the panel comes back as a single string.
+    """
+    panel = []
+    
+    print(f"Processing {tif_path}...")
+    
+    with rasterio.open(tif_path) as src:
+        window = from_bounds(10.0, -35.0, 40.0, -5.0, src.transform)
+        transform = src.window_transform(window)
+        if zones_as_image:
             data = src.read(1, window=window)
-            transform = src.window_transform(window)
-            
-            height, width = data.shape
-            west, north = transform * (0, 0)
-            east, south = transform * (width, height)
+        else:
+            # Halve the resolution before tracing zone boundaries: a 0.2 degree
+            # cell is still only a few pixels on the map, and tracing cost and
+            # path size grow with the number of boundary vertices. GDAL
+            # samples every other pixel while reading
+            out_shape = (math.ceil(window.height / 2), math.ceil(window.width / 2))
+            data = src.read(1, window=window, out_shape=out_shape, resampling=Resampling.nearest)
+            transform *= Affine.scale(window.width / out_shape[1], window.height / out_shape[0])
         
-        # Map border
-        dwg.add(dwg.rect(
-            insert=(x_offset - 2, y_offset - 2),
-            size=(map_width + 4, map_height + 4),
-            fill='none',
-            stroke='#2c3e50',
-            stroke_width=2
+        height, width = data.shape
+        west, north = transform * (0, 0)
+        east, south = transform * (width, height)
+    
+    # Map border
+    panel.append(svg_element(
+        'rect',
+        x=x_offset - 2, y=y_offset - 2,
+        width=map_width + 4, height=map_height + 4,
+        fill='none',
+        stroke='#2c3e50',
+        stroke_width=2
+    ))
+    
+    if zones_as_image:
+        # One palette PNG per panel at full resolution: a fraction of the
+        # size of the traced paths, but the zones are no longer shapes
+        panel.append(svg_element(
+            'image',
+            x=x_offset, y=y_offset,
+            width=map_width, height=map_height,
+            preserveAspectRatio='none',
+            image_rendering='optimizeSpeed',
+            **{'xlink:href': png_data_uri(data)}
         ))
-        
-        # Process climate zones
-        for climate_value in sorted(np.unique(data[data > 0])):
-            if climate_value in koppen_colors:
-                mask = (data == climate_value).astype(np.uint8)
-                
-                try:
-                    polygon_gen = shapes(mask, mask=mask, transform=transform)
-                    polygons = []
-                    
-                    for geom, value in polygon_gen:
-                        if value == 1:
-                            poly = shape(geom)
-                            if poly.area > 0.005:
-                                polygons.append(poly)
-                    
-                    if polygons:
-                        merged = unary_union(polygons)
-                        
-                        if hasattr(merged, 'geoms'):
-                            for poly in merged.geoms:
-                                svg_path = create_svg_path(poly, west, east, north, south, map_width, map_height)
-                                if svg_path:
-                                    dwg.add(dwg.path(
-                                        d=svg_path,
-                                        fill=koppen_colors[climate_value],
-                                        stroke='none',
-                                        transform=f'translate({x_offset}, {y_offset})'
-                                    ))
-                        else:
-                            svg_path = create_svg_path(merged, west, east, north, south, map_width, map_height)
-                            if svg_path:
-                                dwg.add(dwg.path(
-                                    d=svg_path,
-                                    fill=koppen_colors[climate_value],
-                                    stroke='none',
-                                    transform=f'translate({x_offset}, {y_offset})'
-                                ))
-                                
-                except Exception as e:
-                    print(f"Error processing zone {climate_value}: {e}")
-        
-        # Add study sites
-        if show_sites:
-            for site in study_sites:
-                x, y = coords_to_svg(site['lon'], site['lat'], west, east, north, south, map_width, map_height)
-                
-                # Site marker
-                dwg.add(dwg.circle(
-                    center=(x_offset + x, y_offset + y),
-                    r=6,
+        zones = {}
+    else:
+        zones = zone_polygons(data, transform)
+    
+    # Process climate zones, all traced in a single pass over the raster.
+    # Holes are kept as even-odd subpaths so zones inside them show through;
+    # the attributes shared by a zone's paths are set once on its group
+    for climate_value, polygons in zones.items():
+        paths = ''.join(
+            f'<path d="{create_svg_path(rings, west, east, north, south, map_width, map_height)}" />'
+            for rings in polygons
+        )
+        panel.append(svg_element(
+            'g', markup=paths,
+            fill=koppen_colors[climate_value],
+            fill_rule='evenodd',
+            transform=f'translate({x_offset}, {y_offset})'
+        ))
+    
+    # Add study sites
+    if show_sites:
+        for site in study_sites:
+            x, y = coords_to_svg(site['lon'], site['lat'], west, east, north, south, map_width, map_height)
+            
+            # Site marker
+            panel.append(svg_element(
+                'circle',
+                cx=x_offset + x, cy=y_offset + y,
+                r=6,
+                fill='white',
+                stroke='black',
+                stroke_width=2
+            ))
+            
+            # Label if requested
+            if show_labels:
+                text_width = len(site['name']) * 6
+                panel.append(svg_element(
+                    'rect',
+                    x=x_offset + x - text_width//2 - 2, y=y_offset + y - 22,
+                    width=text_width + 4, height=14,
                     fill='white',
                     stroke='black',
-                    stroke_width=2
+                    stroke_width=1,
+                    opacity=0.9
                 ))
                 
-                # Label if requested
-                if show_labels:
-                    text_width = len(site['name']) * 6
-                    dwg.add(dwg.rect(
-                        insert=(x_offset + x - text_width//2 - 2, y_offset + y - 22),
-                        size=(text_width + 4, 14),
-                        fill='white',
-                        stroke='black',
-                        stroke_width=1,
-                        opacity=0.9
-                    ))
-                    
-                    dwg.add(dwg.text(
-                        site['name'],
-                        insert=(x_offset + x, y_offset + y - 12),
-                        text_anchor='middle',
-                        font_family='Arial, sans-serif',
-                        font_size='11px',
-                        fill='black',
-                        font_weight='bold'
-                    ))
-        
-        # Scenario title box
-        title_lines = title.split('\n')
-        title_box_height = 40
-        title_y = y_offset - title_box_height - 10
-        
-        dwg.add(dwg.rect(
-            insert=(x_offset, title_y),
-            size=(map_width, title_box_height),
-            fill=color,
-            stroke='#2c3e50',
-            stroke_width=1
-        ))
-        
-        dwg.add(dwg.text(
-            title_lines[0],
-            insert=(x_offset + map_width//2, title_y + 16),
-            text_anchor='middle',
-            font_family='Arial, sans-serif',
-            font_size='15px',
-            fill='white',
-            font_weight='bold'
-        ))
-        
-        dwg.add(dwg.text(
-            title_lines[1],
-            insert=(x_offset + map_width//2, title_y + 32),
-            text_anchor='middle',
-            font_family='Arial, sans-serif',
-            font_size='12px',
-            fill='white'
-        ))
+                panel.append(svg_element(
+                    'text', site['name'],
+                    x=x_offset + x, y=y_offset + y - 12,
+                    text_anchor='middle',
+                    font_family='Arial, sans-serif',
+                    font_size='11px',
+                    fill='black',
+                    font_weight='bold'
+                ))
     
-    # CONDENSED LEGEND - Compact 2-column layout
-    legend_start_y = y_offset + map_height + 30
-    legend_width = 800  # Narrower legend
-    legend_x = (total_width - legend_width) // 2  # Center the legend
+    # Scenario title box
+    title_lines = title.split('\n')
+    title_box_height = 40
+    title_y = y_offset - title_box_height - 10
+    
+    panel.append(svg_element(
+        'rect',
+        x=x_offset, y=title_y,
+        width=map_width, height=title_box_height,
+        fill=color,
+        stroke='#2c3e50',
+        stroke_width=1
+    ))
     
-    # Legend title
-    dwg.add(dwg.text(
-        'Köppen-Geiger Climate Classification',
-        insert=(total_width // 2, legend_start_y),
+    panel.append(svg_element(
+        'text', title_lines[0],
+        x=x_offset + map_width//2, y=title_y + 16,
         text_anchor='middle',
         font_family='Arial, sans-serif',
-        font_size='16px',
-        fill='#2c3e50',
+        font_size='15px',
+        fill='white',
         font_weight='bold'
     ))
     
+    panel.append(svg_element(
+        'text', title_lines[1],
+        x=x_offset + map_width//2, y=title_y + 32,
+        text_anchor='middle',
+        font_family='Arial, sans-serif',
+        font_size='12px',
+        fill='white'
+    ))
+    
+    return ''.join(panel)
+
+def create_condensed_layout(tif_paths, output_path, show_sites=True, show_labels=True, zones_as_image=False):
+    """Create layout with condensed legend"""
+    
+    # Optimized canvas size
+    total_width, total_height = 2000, 1200
+    map_width, map_height = 600, 650  # Slightly taller maps
+    top_margin = 80
+    side_margin = 50
+    map_spacing = 60
+    
+    # Process each time period
+    titles = ['Current Climate\n1991-2020 Baseline', 'Moderate Warming\nSSP1-2.6 2041-2070', 'Extreme Warming\nSSP5-8.5 2071-2099']
+    scenario_colors = ['#27ae60', '#f39c12', '#e74c3c']
+    
+    # The panels are independent, so each period is read, traced and
+    # serialized in its own process
+    panel_args = [
+        (tif_path, title, color, side_margin + i * (map_width + map_spacing))
+        for i, (tif_path, title, color) in enumerate(zip(tif_paths, titles, scenario_colors))
+        if os.path.exists(tif_path)
+    ]
+    worker = partial(build_panel, y_offset=top_margin, map_width=map_width, map_height=map_height,
+                     show_sites=show_sites, show_labels=show_labels, zones_as_image=zones_as_image)
+    workers = min(len(panel_args), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            panels = list(executor.map(worker, *zip(*panel_args)))
+    else:
+        panels = [worker(*args) for args in panel_args]
+    
+    # CONDENSED LEGEND - Compact 2-column layout
+    legend_start_y = top_margin + map_height + 30
+    legend_width = 800  # Narrower legend
+    legend_x = (total_width - legend_width) // 2  # Center the legend
+    
     # Two-column legend layout
     legend_y = legend_start_y + 25
     col_width = legend_width // 2
@@ -296,105 +426,64 @@ def create_condensed_layout(tif_paths, output_path, show_sites=True, show_labels
     left_groups = condensed_legend[:2]   # A, B
     right_groups = condensed_legend[2:]  # C, E
     
-    # Left column
-    current_y = legend_y
-    for group_name, items in left_groups:
-        # Group title
-        dwg.add(dwg.text(
-            group_name,
-            insert=(legend_x + 20, current_y),
+    # Data source (compact)
+    citation_y = total_height - 50
+    
+    # The document is written element by element as formatted markup
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(svg_header_template.format(width=total_width, height=total_height))
+        
+        # White background
+        f.write(svg_element('rect', x=0, y=0, width=total_width, height=total_height, fill='white'))
+        
+        # Main title
+        f.write(svg_element(
+            'text', 'Köppen-Geiger Climate Classification: Southern Africa',
+            x=total_width // 2, y=35,
+            text_anchor='middle',
             font_family='Arial, sans-serif',
-            font_size='12px',
+            font_size='24px',
             fill='#2c3e50',
             font_weight='bold'
         ))
         
-        current_y += 18
-        for code, description, value in items:
-            if value in koppen_colors:
-                # Color swatch
-                dwg.add(dwg.rect(
-                    insert=(legend_x + 30, current_y - 8),
-                    size=(12, 10),
-                    fill=koppen_colors[value],
-                    stroke='#333',
-                    stroke_width=0.5
-                ))
-                
-                # Text
-                dwg.add(dwg.text(
-                    f'{code} - {description}',
-                    insert=(legend_x + 48, current_y),
-                    font_family='Arial, sans-serif',
-                    font_size='10px',
-                    fill='black'
-                ))
-                
-                current_y += 15
+        for panel in panels:
+            f.write(panel)
         
-        current_y += 10  # Space between groups
-    
-    # Right column
-    current_y = legend_y
-    for group_name, items in right_groups:
-        # Group title
-        dwg.add(dwg.text(
-            group_name,
-            insert=(legend_x + col_width + 20, current_y),
+        # Legend title
+        f.write(svg_element(
+            'text', 'Köppen-Geiger Climate Classification',
+            x=total_width // 2, y=legend_start_y,
+            text_anchor='middle',
             font_family='Arial, sans-serif',
-            font_size='12px',
+            font_size='16px',
             fill='#2c3e50',
             font_weight='bold'
         ))
         
-        current_y += 18
-        for code, description, value in items:
-            if value in koppen_colors:
-                # Color swatch
-                dwg.add(dwg.rect(
-                    insert=(legend_x + col_width + 30, current_y - 8),
-                    size=(12, 10),
-                    fill=koppen_colors[value],
-                    stroke='#333',
-                    stroke_width=0.5
-                ))
-                
-                # Text
-                dwg.add(dwg.text(
-                    f'{code} - {description}',
-                    insert=(legend_x + col_width + 48, current_y),
-                    font_family='Arial, sans-serif',
-                    font_size='10px',
-                    fill='black'
-                ))
-                
-                current_y += 15
+        f.write(legend_column_svg(left_groups, legend_x, legend_y))
+        f.write(legend_column_svg(right_groups, legend_x + col_width, legend_y))
         
-        current_y += 10
-    
-    # Data source (compact)
-    citation_y = total_height - 50
-    
-    dwg.add(dwg.text(
-        'Beck, H.E. et al. (2023). High-resolution Köppen-Geiger maps. Scientific Data 10, 724. DOI: 10.1038/s41597-023-02549-6',
-        insert=(total_width // 2, citation_y),
-        text_anchor='middle',
-        font_family='Arial, sans-serif',
-        font_size='10px',
-        fill='#7f8c8d'
-    ))
-    
-    dwg.add(dwg.text(
-        'Climate Centre for Southern Africa • Wellcome Trust Grant Application',
-        insert=(total_width // 2, citation_y + 20),
-        text_anchor='middle',
-        font_family='Arial, sans-serif',
-        font_size='9px',
-        fill='#95a5a6',
-        font_style='italic'
-    ))
-    
-    dwg.save()
+        f.write(svg_element(
+            'text', 'Beck, H.E. et al. (2023). High-resolution Köppen-Geiger maps. Scientific Data 10, 724. DOI: 10.1038/s41597-023-02549-6',
+            x=total_width // 2, y=citation_y,
+            text_anchor='middle',
+            font_family='Arial, sans-serif',
+            font_size='10px',
+            fill='#7f8c8d'
+        ))
+        
+        f.write(svg_element(
+            'text', 'Climate Centre for Southern Africa • Wellcome Trust Grant Application',
+            x=total_width // 2, y=citation_y + 20,
+            text_anchor='middle',
+            font_family='Arial, sans-serif',
+            font_size='9px',
+            fill='#95a5a6',
+            font_style='italic'
+        ))
+        
+        f.write('</svg>')
     print(f"Created condensed layout: {output_path}")
 
 def main():
@@ -414,6 +503,15 @@ def main():
         show_sites=True,
         show_labels=True
     )
+    
+    # Compact version with the zones as embedded images
+    create_condensed_layout(
+        tif_paths,
+        os.path.join(output_dir, 'koppen_condensed_labeled_compact.svg'),
+        show_sites=True,
+        show_labels=True,
+        zones_as_image=True
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,7 +2,10 @@
 import rasterio
 import numpy as np
 import svgwrite
+from rasterio.enums import Resampling
 from rasterio.windows import from_bounds
+from functools import lru_cache
+import math
 import os
 
 # Köppen-Geiger legend mapping (RGB values)
@@ -46,21 +49,33 @@ study_sites = [
     {'name': 'Blantyre', 'lat': -15.7870, 'lon': 35.0055}
 ]
 
-def create_optimized_svg(tif_path, output_path, title, show_sites=True, show_labels=True):
-    """Create optimized SVG using simplified polygons"""
-    
-    print(f"Processing {tif_path}...")
+@lru_cache(maxsize=1)
+def read_southern_africa(tif_path):
+    """Read the Southern Africa window of a TIF, sampled every 4th pixel
     
+    The three map versions of a period are made back to back, so caching the
+    last read serves the second and third from memory.
+    """
     with rasterio.open(tif_path) as src:
         # Focus on Southern Africa region
         window = from_bounds(10.0, -35.0, 40.0, -5.0, src.transform)
-        data = src.read(1, window=window)
-        transform = src.window_transform(window)
-        
-        # Reduce resolution for efficiency
-        data = data[::4, ::4]  # Sample every 4th pixel
-        height, width = data.shape
         
+        # Reduce resolution for efficiency: GDAL samples every 4th pixel
+        # while reading, so the full-resolution window is never loaded
+        out_shape = (math.ceil(window.height / 4), math.ceil(window.width / 4))
+        data = src.read(1, window=window, out_shape=out_shape, resampling=Resampling.nearest)
+    
+    data.flags.writeable = False
+    return data
+
+def create_optimized_svg(tif_path, output_path, title, show_sites=True, show_labels=True):
+    """Create optimized SVG using simplified polygons"""
+    
+    print(f"Processing {tif_path}...")
+    
+    data = read_southern_africa(tif_path)
+    height, width = data.shape
+    
     # SVG dimensions
     svg_width, svg_height = 800, 600
     dwg = svgwrite.Drawing(output_path, size=(svg_width, svg_height))
@@ -70,31 +85,27 @@ def create_optimized_svg(tif_path, output_path, title, show_sites=True, show_lab
     
     # Group similar climate zones into larger polygons
     unique_values = np.unique(data[data > 0])
+    rect_size = max(2, svg_width / width * 4)
     
     for value in unique_values:
         if value in koppen_colors:
-            # Find all pixels with this climate type
-            mask = (data == value)
-            y_coords, x_coords = np.where(mask)
+            # Every 50th pixel with this climate type, in row order
+            y_coords, x_coords = np.where(data == value)
+            y_coords, x_coords = y_coords[::50], x_coords[::50]
+            
+            # Small rectangles centred on the sampled pixels, in SVG coordinates
+            rect_xs = (x_coords / width) * svg_width - rect_size/2
+            rect_ys = (y_coords / height) * svg_height - rect_size/2
             
-            if len(y_coords) > 0:
-                # Create simplified polygon using convex hull approach
-                for i in range(0, len(y_coords), 50):  # Sample points
-                    y, x = y_coords[i], x_coords[i]
-                    
-                    # Convert to SVG coordinates
-                    svg_x = (x / width) * svg_width
-                    svg_y = (y / height) * svg_height
-                    
-                    # Create small rectangles for climate zones
-                    rect_size = max(2, svg_width / width * 4)
-                    dwg.add(dwg.rect(
-                        insert=(svg_x - rect_size/2, svg_y - rect_size/2),
-                        size=(rect_size, rect_size),
-                        fill=koppen_colors[value],
-                        stroke='none',
-                        opacity=0.8
-                    ))
+            # One path per zone with a square subpath per sample. The squares
+            # fill as their union, so overlaps no longer stack opacity
+            square_format = "M{:.1f} {:.1f}h{size:.1f}v{size:.1f}h-{size:.1f}Z"
+            corners = np.column_stack([rect_xs, rect_ys]).ravel().tolist()
+            dwg.add(dwg.path(
+                d=(square_format * len(rect_xs)).format(*corners, size=rect_size),
+                fill=koppen_colors[value],
+                fill_opacity=0.8
+            ))
     
     # Add study sites
     if show_sites:
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import rasterio
 import numpy as np
-import svgwrite
+from rasterio import Affine
+from rasterio.enums import Resampling
 from rasterio.windows import from_bounds
 from rasterio.features import shapes
-from shapely.geometry import shape
-from shapely.ops import unary_union
+import shapely
+from functools import lru_cache, partial
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+import math
 import os
 
 # Study sites
@@ -108,214 +113,192 @@ legend_data = {
     }
 }
 
+# Zone path vertices are whole units of a grid this many times finer than
+# the map, a tenth of a map pixel as with one-decimal coordinates
+zone_path_scale = 10
+
+svg_header_template = (
+    '<?xml version="1.0" encoding="utf-8" ?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+    'version="1.1" width="{width}" height="{height}">'
+)
+
+def svg_element(tag, text=None, markup=None, **attributes):
+    """Format one SVG element; underscores in attribute names become hyphens as in svgwrite
+    
+    Attribute values and text are XML-escaped as svgwrite did; markup holds
+    already formatted child elements and is written as is.
+    """
+    attrs = ''.join(f' {name.replace("_", "-")}={quoteattr(str(value))}' for name, value in attributes.items())
+    if text is not None:
+        markup = escape(text)
+    if markup is None:
+        return f'<{tag}{attrs} />'
+    return f'<{tag}{attrs}>{markup}</{tag}>'
+
 def coords_to_svg(lon, lat, west, east, north, south, svg_width, svg_height):
     """Convert geographic coordinates to SVG coordinates"""
     x = ((lon - west) / (east - west)) * svg_width
     y = ((north - lat) / (north - south)) * svg_height
     return x, y
 
-def create_svg_path(polygon, west, east, north, south, svg_width, svg_height):
-    """Convert shapely polygon to SVG path"""
-    try:
-        if polygon.is_empty or polygon.area < 0.001:
-            return None
-            
-        coords = list(polygon.exterior.coords)
-        if not coords:
-            return None
-            
-        path_data = []
-        for i, (lon, lat) in enumerate(coords):
-            x, y = coords_to_svg(lon, lat, west, east, north, south, svg_width, svg_height)
-            if i == 0:
-                path_data.append(f"M {x:.1f} {y:.1f}")
-            else:
-                path_data.append(f"L {x:.1f} {y:.1f}")
-        
-        path_data.append("Z")
-        return " ".join(path_data)
-        
-    except Exception:
-        return None
-
-def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True, show_labels=True):
-    """Create optimized scientific layout using full canvas"""
+def create_svg_paths(polygons, west, east, north, south, svg_width, svg_height):
+    """Convert an array of shapely polygons to SVG paths of their exteriors
     
-    # Larger canvas with better space utilization
-    total_width, total_height = 2000, 1400
-    map_width, map_height = 600, 700  # Larger maps
-    top_margin = 80
-    side_margin = 50
-    map_spacing = 60
+    All rings go through coords_to_svg's arithmetic as one array and are
+    formatted by a single str.format call, one path per line. Vertices are
+    whole units of a grid zone_path_scale times finer than the map, so the
+    paths are drawn under a matching scale() transform.
+    """
+    if not len(polygons):
+        return []
     
-    dwg = svgwrite.Drawing(output_path, size=(total_width, total_height))
+    rings = shapely.get_exterior_ring(polygons)
+    coords = shapely.get_coordinates(rings)
     
-    # White background
-    dwg.add(dwg.rect(insert=(0, 0), size=(total_width, total_height), fill='white'))
+    points = np.empty_like(coords)
+    points[:, 0] = ((coords[:, 0] - west) / (east - west)) * svg_width
+    points[:, 1] = ((north - coords[:, 1]) / (north - south)) * svg_height
+    points = np.rint(points * zone_path_scale).astype(np.int64)
     
-    # Main title
-    dwg.add(dwg.text(
-        'Köppen-Geiger Climate Classification: Southern Africa',
-        insert=(total_width // 2, 35),
-        text_anchor='middle',
-        font_family='Arial, sans-serif',
-        font_size='24px',
-        fill='#2c3e50',
-        font_weight='bold'
-    ))
+    paths_format = "\n".join(
+        "M {} {} " + "L {} {} " * (count - 1) + "Z"
+        for count in shapely.get_num_coordinates(rings).tolist()
+    )
+    return paths_format.format(*points.ravel().tolist()).split("\n")
+
+def trace_zones(data, transform, min_area=0.005):
+    """Trace every Köppen class in one pass into arrays of polygons and their climate values
     
+    Each polygon is a connected region of a single class, so polygons of one
+    class never overlap and need no union. The rings from shapes() are built
+    into polygons and filtered by area (square degrees) in batch.
+    """
+    # One histogram pass finds the classes present. A class with too few
+    # cells to make up a single polygon above min_area is left out of the
+    # trace, as are values without a Köppen colour.
+    cell_counts = np.bincount(data.ravel())
+    cell_area = abs(transform.a * transform.e)
+    known_values = [value for value in koppen_colors if value < len(cell_counts)]
+    traced_values = np.zeros(len(cell_counts), dtype=bool)
+    traced_values[known_values] = cell_counts[known_values] * cell_area > min_area
+    if not traced_values.any():
+        return np.empty(0, dtype=object), np.empty(0, dtype=data.dtype)
     
-    # Process each time period
-    titles = ['Current Climate\n1991-2020 Baseline', 'Moderate Warming\nSSP1-2.6 2041-2070', 'Extreme Warming\nSSP5-8.5 2071-2099']
-    scenario_colors = ['#27ae60', '#f39c12', '#e74c3c']  # Scientific green, orange, red
+    traced = [(geom['coordinates'], value)
+              for geom, value in shapes(data, mask=traced_values[data], transform=transform)]
+    if not traced:
+        return np.empty(0, dtype=object), np.empty(0, dtype=data.dtype)
     
-    for i, (tif_path, title, color) in enumerate(zip(tif_paths, titles, scenario_colors)):
-        if not os.path.exists(tif_path):
-            continue
-            
-        x_offset = side_margin + i * (map_width + map_spacing)
-        y_offset = top_margin + 20
-        
+    rings = [ring for coordinates, _ in traced for ring in coordinates]
+    ring_index = np.repeat(np.arange(len(traced)), [len(coordinates) for coordinates, _ in traced])
+    coord_index = np.repeat(np.arange(len(rings)), [len(ring) for ring in rings])
+    # The vertex tuples go straight into one flat array, without a
+    # per-ring array to concatenate
+    coords = np.fromiter(chain.from_iterable(chain.from_iterable(rings)), dtype=float,
+                         count=2 * len(coord_index)).reshape(-1, 2)
+    polygons = shapely.polygons(
+        shapely.linearrings(coords, indices=coord_index),
+        indices=ring_index
+    )
+    values = np.array([value for _, value in traced], dtype=data.dtype)
+    
+    # Filter small artifacts
+    large = shapely.area(polygons) > min_area
+    return polygons[large], values[large]
+
+def read_map_window(tif_path, map_width):
+    """Read a period's Southern Africa window, with no more cells across than map pixels"""
+    with rasterio.open(tif_path) as src:
         print(f"Processing {tif_path}...")
         
-        with rasterio.open(tif_path) as src:
-            # Southern Africa focus
-            window = from_bounds(10.0, -35.0, 40.0, -5.0, src.transform)
-            data = src.read(1, window=window)
-            transform = src.window_transform(window)
-            
-            height, width = data.shape
-            west, north = transform * (0, 0)
-            east, south = transform * (width, height)
-        
-        # Map border
-        dwg.add(dwg.rect(
-            insert=(x_offset - 2, y_offset - 2),
-            size=(map_width + 4, map_height + 4),
-            fill='none',
-            stroke='#2c3e50',
-            stroke_width=2
-        ))
-        
-        # Process climate zones
-        sample_factor = max(1, width // 400)
-        
-        for climate_value in sorted(np.unique(data[data > 0])):
-            if climate_value in koppen_colors:
-                mask = (data == climate_value).astype(np.uint8)
-                
-                try:
-                    polygon_gen = shapes(mask, mask=mask, transform=transform)
-                    polygons = []
-                    
-                    for geom, value in polygon_gen:
-                        if value == 1:
-                            poly = shape(geom)
-                            if poly.area > 0.005:  # Filter small artifacts
-                                polygons.append(poly)
-                    
-                    if polygons:
-                        merged = unary_union(polygons)
-                        
-                        if hasattr(merged, 'geoms'):
-                            for poly in merged.geoms:
-                                svg_path = create_svg_path(poly, west, east, north, south, map_width, map_height)
-                                if svg_path:
-                                    dwg.add(dwg.path(
-                                        d=svg_path,
-                                        fill=koppen_colors[climate_value],
-                                        stroke='none',
-                                        transform=f'translate({x_offset}, {y_offset})'
-                                    ))
-                        else:
-                            svg_path = create_svg_path(merged, west, east, north, south, map_width, map_height)
-                            if svg_path:
-                                dwg.add(dwg.path(
-                                    d=svg_path,
-                                    fill=koppen_colors[climate_value],
-                                    stroke='none',
-                                    transform=f'translate({x_offset}, {y_offset})'
-                                ))
-                                
-                except Exception as e:
-                    print(f"Error processing zone {climate_value}: {e}")
-        
-        # Add study sites
-        if show_sites:
-            for site in study_sites:
-                x, y = coords_to_svg(site['lon'], site['lat'], west, east, north, south, map_width, map_height)
-                
-                # White circle with black border (standard scientific style)
-                dwg.add(dwg.circle(
-                    center=(x_offset + x, y_offset + y),
-                    r=8,
-                    fill='white',
-                    stroke='black',
-                    stroke_width=2
-                ))
-                
-                # Label if requested
-                if show_labels:
-                    # White background for text readability
-                    text_width = len(site['name']) * 7
-                    dwg.add(dwg.rect(
-                        insert=(x_offset + x - text_width//2 - 3, y_offset + y - 25),
-                        size=(text_width + 6, 16),
-                        fill='white',
-                        stroke='black',
-                        stroke_width=1,
-                        opacity=0.9
-                    ))
-                    
-                    dwg.add(dwg.text(
-                        site['name'],
-                        insert=(x_offset + x, y_offset + y - 12),
-                        text_anchor='middle',
-                        font_family='Arial, sans-serif',
-                        font_size='12px',
-                        fill='black',
-                        font_weight='bold'
-                    ))
-        
-        # Scenario title box
-        title_lines = title.split('\n')
-        title_box_height = 45
-        title_y = y_offset - title_box_height - 10
-        
-        dwg.add(dwg.rect(
-            insert=(x_offset, title_y),
-            size=(map_width, title_box_height),
-            fill=color,
-            stroke='#2c3e50',
-            stroke_width=1
-        ))
-        
-        dwg.add(dwg.text(
-            title_lines[0],
-            insert=(x_offset + map_width//2, title_y + 18),
-            text_anchor='middle',
-            font_family='Arial, sans-serif',
-            font_size='16px',
-            fill='white',
-            font_weight='bold'
-        ))
+        # Southern Africa focus
+        window = from_bounds(10.0, -35.0, 40.0, -5.0, src.transform)
+        transform = src.window_transform(window)
         
-        dwg.add(dwg.text(
-            title_lines[1],
-            insert=(x_offset + map_width//2, title_y + 35),
-            text_anchor='middle',
-            font_family='Arial, sans-serif',
-            font_size='13px',
-            fill='white'
+        # Finer grids (such as the 1 km product) are sampled down by GDAL
+        # while reading
+        sample_factor = max(1, int(window.width) // map_width)
+        out_shape = (math.ceil(window.height / sample_factor), math.ceil(window.width / sample_factor))
+        data = src.read(1, window=window, out_shape=out_shape, resampling=Resampling.nearest)
+        transform *= Affine.scale(window.width / out_shape[1], window.height / out_shape[0])
+    
+    return data, transform
+
+def build_map_layer(data, transform, map_width, map_height):
+    """Trace a period's climate zones as SVG path data
+    
+    Returns the window bounds (west, east, north, south) and a tuple of
+    (climate value, path data strings) pairs.
+    """
+    height, width = data.shape
+    west, north = transform * (0, 0)
+    east, south = transform * (width, height)
+    
+    # Process climate zones
+    polygons, values = trace_zones(data, transform)
+    
+    # Straighten the traced pixel staircases. The zones tile the window, so
+    # they are simplified as one coverage and neighbours keep sharing their
+    # edges. The tolerance is roughly the square root of the triangle area
+    # removed: three quarters of a cell takes out the half-cell corners of
+    # single-cell steps
+    polygons = shapely.coverage_simplify(polygons, abs(transform.a) * 0.75)
+    
+    # Outlines that simplify away, or down to slivers, are not drawn
+    drawn = ~shapely.is_empty(polygons) & (shapely.area(polygons) >= 0.001)
+    polygons, values = polygons[drawn], values[drawn]
+    
+    # Bucket the polygons by climate value with one stable sort, keeping
+    # their traced order within each zone
+    order = np.argsort(values, kind='stable')
+    zone_values, zone_starts = np.unique(values[order], return_index=True)
+    zone_ends = zone_starts[1:].tolist() + [len(order)]
+    svg_paths = create_svg_paths(polygons[order], west, east, north, south, map_width, map_height)
+    
+    zones = []
+    for climate_value, start, end in zip(zone_values.tolist(), zone_starts.tolist(), zone_ends):
+        zones.append((climate_value, tuple(svg_paths[start:end])))
+    
+    return (west, east, north, south), tuple(zones)
+
+def load_map_layer(tif_path, map_width, map_height):
+    """Read and trace one period's map layer, or None if its TIF cannot be read"""
+    try:
+        data, transform = read_map_window(tif_path, map_width)
+    except OSError:
+        return None
+    return build_map_layer(data, transform, map_width, map_height)
+
+@lru_cache(maxsize=1)
+def build_map_layers(tif_paths, map_width, map_height):
+    """Build the map layer of each period, or None where its TIF cannot be read
+    
+    The layout variants differ only in their overlays, so the layers are
+    cached per set of TIFs and map size. Each period is read and traced in
+    its own worker process and comes back as plain path strings. On a single
+    core the workers are threads instead: GDAL releases the GIL, so the reads
+    of the (possibly cold, cloud-synced) files still overlap.
+    """
+    executor_class = ProcessPoolExecutor if (os.cpu_count() or 1) > 1 else ThreadPoolExecutor
+    with executor_class(max_workers=max(1, len(tif_paths))) as executor:
+        return tuple(executor.map(
+            partial(load_map_layer, map_width=map_width, map_height=map_height), tif_paths
         ))
+
+@lru_cache(maxsize=1)
+def legend_and_citation_svg(total_width, total_height, side_margin, legend_start_y):
+    """Format the Köppen-Geiger legend and the data source footer as SVG markup
     
-    # Köppen-Geiger legend (optimized spacing)
-    legend_start_y = y_offset + map_height + 40
+    Both are the same in every layout variant, so the markup is built once
+    and written as is into each file.
+    """
+    markup = []
     
     # Legend title
-    dwg.add(dwg.text(
-        'Köppen-Geiger Climate Classification',
-        insert=(total_width // 2, legend_start_y),
+    markup.append(svg_element(
+        'text', 'Köppen-Geiger Climate Classification',
+        x=total_width // 2, y=legend_start_y,
         text_anchor='middle',
         font_family='Arial, sans-serif',
         font_size='18px',
@@ -331,9 +314,9 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
         group_x = side_margin + i * group_width
         
         # Group header
-        dwg.add(dwg.text(
-            group_name,
-            insert=(group_x + group_width//2, legend_y),
+        markup.append(svg_element(
+            'text', group_name,
+            x=group_x + group_width//2, y=legend_y,
             text_anchor='middle',
             font_family='Arial, sans-serif',
             font_size='14px',
@@ -346,18 +329,19 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
         for code, description, value in group_info['items']:
             if value in koppen_colors:
                 # Color swatch
-                dwg.add(dwg.rect(
-                    insert=(group_x + 10, item_y - 10),
-                    size=(18, 14),
+                markup.append(svg_element(
+                    'rect',
+                    x=group_x + 10, y=item_y - 10,
+                    width=18, height=14,
                     fill=koppen_colors[value],
                     stroke='#333',
                     stroke_width=0.5
                 ))
                 
                 # Code
-                dwg.add(dwg.text(
-                    code,
-                    insert=(group_x + 35, item_y - 2),
+                markup.append(svg_element(
+                    'text', code,
+                    x=group_x + 35, y=item_y - 2,
                     font_family='Arial, sans-serif',
                     font_size='11px',
                     fill='black',
@@ -365,9 +349,9 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
                 ))
                 
                 # Description
-                dwg.add(dwg.text(
-                    description,
-                    insert=(group_x + 35, item_y + 10),
+                markup.append(svg_element(
+                    'text', description,
+                    x=group_x + 35, y=item_y + 10,
                     font_family='Arial, sans-serif',
                     font_size='10px',
                     fill='#555'
@@ -378,9 +362,9 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
     # Data source and citation (bottom)
     citation_y = total_height - 80
     
-    dwg.add(dwg.text(
-        'Data Source',
-        insert=(total_width // 2, citation_y),
+    markup.append(svg_element(
+        'text', 'Data Source',
+        x=total_width // 2, y=citation_y,
         text_anchor='middle',
         font_family='Arial, sans-serif',
         font_size='14px',
@@ -388,18 +372,18 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
         font_weight='bold'
     ))
     
-    dwg.add(dwg.text(
-        'Beck, H.E. et al. (2023). High-resolution (1 km) Köppen-Geiger maps for 1901–2099 based on constrained CMIP6 projections.',
-        insert=(total_width // 2, citation_y + 20),
+    markup.append(svg_element(
+        'text', 'Beck, H.E. et al. (2023). High-resolution (1 km) Köppen-Geiger maps for 1901–2099 based on constrained CMIP6 projections.',
+        x=total_width // 2, y=citation_y + 20,
         text_anchor='middle',
         font_family='Arial, sans-serif',
         font_size='11px',
         fill='#7f8c8d'
     ))
     
-    dwg.add(dwg.text(
-        'Scientific Data 10, 724. DOI: 10.1038/s41597-023-02549-6',
-        insert=(total_width // 2, citation_y + 35),
+    markup.append(svg_element(
+        'text', 'Scientific Data 10, 724. DOI: 10.1038/s41597-023-02549-6',
+        x=total_width // 2, y=citation_y + 35,
         text_anchor='middle',
         font_family='Arial, sans-serif',
         font_size='11px',
@@ -407,17 +391,158 @@ def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True,
     ))
     
     # Research context
-    dwg.add(dwg.text(
-        'Climate Centre for Southern Africa • Wellcome Trust Grant Application',
-        insert=(total_width // 2, citation_y + 55),
+    markup.append(svg_element(
+        'text', 'Climate Centre for Southern Africa • Wellcome Trust Grant Application',
+        x=total_width // 2, y=citation_y + 55,
         text_anchor='middle',
         font_family='Arial, sans-serif',
         font_size='10px',
         fill='#95a5a6',
         font_style='italic'
     ))
+    return ''.join(markup)
+
+def create_optimized_scientific_layout(tif_paths, output_path, show_sites=True, show_labels=True):
+    """Create optimized scientific layout using full canvas"""
+    
+    # Larger canvas with better space utilization
+    total_width, total_height = 2000, 1400
+    map_width, map_height = 600, 700  # Larger maps
+    top_margin = 80
+    side_margin = 50
+    map_spacing = 60
+    legend_start_y = top_margin + 20 + map_height + 40
     
-    dwg.save()
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(svg_header_template.format(width=total_width, height=total_height))
+        
+        # White background
+        f.write(svg_element('rect', x=0, y=0, width=total_width, height=total_height, fill='white'))
+        
+        # Main title
+        f.write(svg_element(
+            'text', 'Köppen-Geiger Climate Classification: Southern Africa',
+            x=total_width // 2, y=35,
+            text_anchor='middle',
+            font_family='Arial, sans-serif',
+            font_size='24px',
+            fill='#2c3e50',
+            font_weight='bold'
+        ))
+        
+        
+        # Process each time period
+        titles = ['Current Climate\n1991-2020 Baseline', 'Moderate Warming\nSSP1-2.6 2041-2070', 'Extreme Warming\nSSP5-8.5 2071-2099']
+        scenario_colors = ['#27ae60', '#f39c12', '#e74c3c']  # Scientific green, orange, red
+        
+        layers = build_map_layers(tuple(tif_paths), map_width, map_height)
+        
+        for i, (layer, title, color) in enumerate(zip(layers, titles, scenario_colors)):
+            if layer is None:
+                continue
+                
+            x_offset = side_margin + i * (map_width + map_spacing)
+            y_offset = top_margin + 20
+            
+            (west, east, north, south), zones = layer
+            
+            # Map border
+            f.write(svg_element(
+                'rect',
+                x=x_offset - 2, y=y_offset - 2,
+                width=map_width + 4, height=map_height + 4,
+                fill='none',
+                stroke='#2c3e50',
+                stroke_width=2
+            ))
+            
+            # Climate zones, one group per class so the paths inherit fill and offset
+            zone_transform = f'translate({x_offset}, {y_offset}) scale({1 / zone_path_scale})'
+            for climate_value, svg_paths in zones:
+                f.write(svg_element(
+                    'g',
+                    markup=''.join(f'<path d="{svg_path}" />' for svg_path in svg_paths),
+                    fill=koppen_colors[climate_value],
+                    stroke='none',
+                    transform=zone_transform
+                ))
+            
+            # Add study sites
+            if show_sites:
+                for site in study_sites:
+                    x, y = coords_to_svg(site['lon'], site['lat'], west, east, north, south, map_width, map_height)
+                    
+                    # White circle with black border (standard scientific style)
+                    f.write(svg_element(
+                        'circle',
+                        cx=x_offset + x, cy=y_offset + y,
+                        r=8,
+                        fill='white',
+                        stroke='black',
+                        stroke_width=2
+                    ))
+                    
+                    # Label if requested
+                    if show_labels:
+                        # White background for text readability
+                        text_width = len(site['name']) * 7
+                        f.write(svg_element(
+                            'rect',
+                            x=x_offset + x - text_width//2 - 3, y=y_offset + y - 25,
+                            width=text_width + 6, height=16,
+                            fill='white',
+                            stroke='black',
+                            stroke_width=1,
+                            opacity=0.9
+                        ))
+                        
+                        f.write(svg_element(
+                            'text', site['name'],
+                            x=x_offset + x, y=y_offset + y - 12,
+                            text_anchor='middle',
+                            font_family='Arial, sans-serif',
+                            font_size='12px',
+                            fill='black',
+                            font_weight='bold'
+                        ))
+            
+            # Scenario title box
+            title_lines = title.split('\n')
+            title_box_height = 45
+            title_y = y_offset - title_box_height - 10
+            
+            f.write(svg_element(
+                'rect',
+                x=x_offset, y=title_y,
+                width=map_width, height=title_box_height,
+                fill=color,
+                stroke='#2c3e50',
+                stroke_width=1
+            ))
+            
+            f.write(svg_element(
+                'text', title_lines[0],
+                x=x_offset + map_width//2, y=title_y + 18,
+                text_anchor='middle',
+                font_family='Arial, sans-serif',
+                font_size='16px',
+                fill='white',
+                font_weight='bold'
+            ))
+            
+            f.write(svg_element(
+                'text', title_lines[1],
+                x=x_offset + map_width//2, y=title_y + 35,
+                text_anchor='middle',
+                font_family='Arial, sans-serif',
+                font_size='13px',
+                fill='white'
+            ))
+        
+        # Köppen-Geiger legend (optimized spacing) and data source
+        f.write(legend_and_citation_svg(total_width, total_height, side_margin, legend_start_y))
+        
+        f.write('</svg>')
     print(f"Created optimized scientific layout: {output_path}")
 
 def main():
@@ -3,6 +3,7 @@ import rasterio
 import numpy as np
 import svgwrite
 from rasterio.windows import from_bounds
+from rasterio.features import shapes
 import os
 from scipy import ndimage
 
@@ -47,6 +48,15 @@ koppen_colors = {
     30: '#666666'   # EF
 }
 
+def create_svg_path(rings, pixel_width, pixel_height):
+    """Convert a polygon's pixel-space rings (exterior first, then holes) to SVG path data"""
+    subpaths = []
+    for ring in rings:
+        # The closing vertex repeats the first; Z closes the ring instead
+        points = (np.asarray(ring[:-1]) * (pixel_width, pixel_height)).ravel().tolist()
+        subpaths.append(("M {:.1f} {:.1f} " + "L {:.1f} {:.1f} " * (len(ring) - 2) + "Z").format(*points))
+    return " ".join(subpaths)
+
 def create_high_quality_svg(tif_path, output_path, title, show_sites=True, show_labels=True):
     """Create high-quality SVG from Köppen-Geiger data"""
     
@@ -77,31 +87,18 @@ def create_high_quality_svg(tif_path, output_path, title, show_sites=True, show_
     pixel_width = svg_width / width
     pixel_height = svg_height / height
     
-    # Create climate zone paths by grouping adjacent pixels
-    for climate_value in np.unique(data[data > 0]):
-        if climate_value in koppen_colors:
-            # Find all pixels with this climate type
-            mask = (data == climate_value)
-            
-            # Create path data for this climate zone
-            path_data = []
-            
-            # Find contiguous regions
-            for i in range(0, height, 2):  # Skip every other row for efficiency
-                for j in range(0, width, 2):  # Skip every other column
-                    if mask[i, j]:
-                        x = j * pixel_width
-                        y = i * pixel_height
-                        
-                        # Create small rectangle for each pixel
-                        rect_size = max(pixel_width, pixel_height) * 2
-                        dwg.add(dwg.rect(
-                            insert=(x, y),
-                            size=(rect_size, rect_size),
-                            fill=koppen_colors[climate_value],
-                            stroke='none',
-                            opacity=0.9
-                        ))
+    # Create one path per contiguous region of a climate type. shapes()
+    # traces every class in one pass, in pixel coordinates; holes are kept
+    # as even-odd subpaths so nested regions are not drawn over twice.
+    classified = np.isin(data, list(koppen_colors))
+    for geom, climate_value in shapes(data, mask=classified):
+        dwg.add(dwg.path(
+            d=create_svg_path(geom['coordinates'], pixel_width, pixel_height),
+            fill=koppen_colors[int(climate_value)],
+            fill_rule='evenodd',
+            stroke='none',
+            opacity=0.9
+        ))
     
     # Add study sites
     if show_sites:
@@ -39,10 +39,13 @@ KOPPEN_MAPPING = {
 def main():
     print("Loading Köppen-Geiger shapefile and adding climate labels...")
     
-    # Load the already converted Africa data
-    gdf_africa = gpd.read_file('koppen_africa.geojson')
+    # Load the already converted Africa data, preferring the GeoParquet copy
+    if os.path.exists('koppen_africa.parquet'):
+        gdf_africa = gpd.read_parquet('koppen_africa.parquet')
+    else:
+        gdf_africa = gpd.read_file('koppen_africa.geojson')
     
-    print(f"Africa dataset contains {len(gdf_africa)} polygons")
+    print(f"Africa dataset contains {len(gdf_africa)} features")
     print(f"Columns: {list(gdf_africa.columns)}")
     
     # Add Köppen climate labels
@@ -62,7 +65,17 @@ def main():
     # Show the climate zones found in African data
     if 'GRIDCODE' in gdf_africa.columns:
         print(f"\nClimate zones in African data:")
-        climate_summary = gdf_africa.groupby(['GRIDCODE', 'koppen_label']).size().reset_index(name='count')
+        # Zones dissolved by convert_koppen_python.py carry the number of
+        # polygons merged into them; undissolved rows are one polygon each
+        if 'polygon_count' in gdf_africa.columns:
+            polygon_counts = gdf_africa['polygon_count']
+        else:
+            polygon_counts = pd.Series(1, index=gdf_africa.index)
+        climate_summary = (
+            polygon_counts.groupby([gdf_africa['GRIDCODE'], gdf_africa['koppen_label']])
+            .sum().reset_index(name='count')
+        )
+        total_polygons = int(climate_summary['count'].sum())
         climate_summary = climate_summary.sort_values('GRIDCODE')
         
         for _, row in climate_summary.iterrows():
@@ -72,6 +85,8 @@ def main():
     print("\nSaving enhanced GeoJSON with Köppen labels...")
     gdf_africa.to_file('koppen_africa_with_labels.geojson', driver='GeoJSON')
     print("✓ Saved: koppen_africa_with_labels.geojson")
+    gdf_africa.to_parquet('koppen_africa_with_labels.parquet', compression='zstd')
+    print("✓ Saved: koppen_africa_with_labels.parquet")
     
     # Create a climate zone summary
     climate_zones = {}
@@ -81,7 +96,7 @@ def main():
                 'label': row['koppen_label'],
                 'short_code': row.get('koppen_code', ''),
                 'polygon_count': int(row['count']),
-                'percentage': round((row['count'] / len(gdf_africa)) * 100, 1)
+                'percentage': round((row['count'] / total_polygons) * 100, 1)
             }
     
     # Create comprehensive metadata
@@ -90,7 +105,7 @@ def main():
         "description": "Climate zones for Africa (2076-2100 A1FI scenario) clipped from global data",
         "source_file": "c2076_2100_A1FI.shp", 
         "processing_date": pd.Timestamp.now().isoformat(),
-        "total_polygons": len(gdf_africa),
+        "total_polygons": total_polygons,
         "unique_climate_zones": len(climate_summary),
         "geographic_extent": {
             "description": "African continent approximately",
@@ -106,6 +121,7 @@ def main():
         "data_fields": {
             "ID": "Original polygon identifier",
             "GRIDCODE": "Numeric climate zone code",
+            "polygon_count": "Number of source polygons dissolved into the feature",
             "koppen_label": "Full Köppen climate classification with description", 
             "koppen_code": "Short Köppen climate code (e.g., Af, BWh, Csa)",
             "geometry": "Polygon geometry in WGS84"
@@ -128,18 +144,19 @@ def main():
     print("CONVERSION COMPLETE - SUMMARY")
     print("="*60)
     print(f"Original global polygons: 1976")
-    print(f"African continent polygons: {len(gdf_africa)}")
+    print(f"African continent polygons: {total_polygons}")
     print(f"Unique climate zones in Africa: {len(climate_summary)}")
     print(f"Geographic coverage: 20°W to 55°E, 35°S to 40°N")
     
     print(f"\nMost common climate zones in Africa:")
     top_zones = climate_summary.nlargest(3, 'count')
     for _, row in top_zones.iterrows():
-        pct = round((row['count'] / len(gdf_africa)) * 100, 1)
+        pct = round((row['count'] / total_polygons) * 100, 1)
         print(f"  • {row['koppen_label']}: {row['count']} polygons ({pct}%)")
     
     print(f"\nFiles created in directory:")
     print(f"• koppen_africa_with_labels.geojson - GeoJSON with climate labels")
+    print(f"• koppen_africa_with_labels.parquet - GeoParquet copy for fast loading")
     print(f"• koppen_africa_complete_metadata.json - Complete dataset documentation")
 
 if __name__ == "__main__":